@@ -3,6 +3,14 @@
 import subprocess
 import os
 
+from source_text import X264_VIDEO_CODEC_ARGS
+
+# Chỉ giữ phần cuối stderr của FFmpeg khi lỗi (đủ để chứa thông báo lỗi)
+ERROR_TAIL_CHARS = 4096
+
+# Encoder video mặc định (CPU, bảng chung trong source_text) - caller truyền video_codec_args khác để dùng encoder GPU
+DEFAULT_VIDEO_CODEC_ARGS = X264_VIDEO_CODEC_ARGS
+
 def add_video_banner(
     main_video_path: str,
     banner_video_path: str,
@@ -16,7 +24,8 @@ def add_video_banner(
     blend: float = 0.2,
     start_time: int = 0,
     end_time: int = 9999,
-    ffmpeg_executable: str = "ffmpeg"
+    ffmpeg_executable: str = "ffmpeg",
+    video_codec_args: tuple = DEFAULT_VIDEO_CODEC_ARGS
 ) -> tuple[bool, str]:
     """
     🔥 FIXED: Overlays a banner video with proper path handling and loop support
@@ -67,9 +76,7 @@ def add_video_banner(
         "-i", banner_video_path,
         "-filter_complex", filter_complex,
         "-c:a", "copy",  # Copy audio
-        "-c:v", "libx264",
-        "-preset", "fast",
-        "-crf", "23",
+        *video_codec_args,
         "-pix_fmt", "yuv420p",
         "-avoid_negative_ts", "make_zero",  # 🔥 Fix timing issues
         "-shortest",  # 🔥 Limit total output duration
@@ -82,7 +89,8 @@ def add_video_banner(
 
         process = subprocess.run(
             command,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,  # FFmpeg chỉ ghi log ra stderr
+            stderr=subprocess.PIPE,
             text=True,
             encoding='utf-8',
             errors='replace',
@@ -92,7 +100,7 @@ def add_video_banner(
         if process.returncode == 0:
             return True, "Banner processing successful with fixed method."
         else:
-            error_message = f"FFmpeg Error (code {process.returncode}):\nSTDERR:\n{process.stderr}\nSTDOUT:\n{process.stdout}"
+            error_message = f"FFmpeg Error (code {process.returncode}):\nSTDERR:\n{process.stderr[-ERROR_TAIL_CHARS:]}"
             return False, error_message
 
     except subprocess.TimeoutExpired:
@@ -32,11 +32,18 @@ def load_api_keys() -> List[str]:
         current_dir = os.path.dirname(os.path.abspath(__file__))
         json_path = os.path.join(current_dir, "api_key.json")
         
-        if not os.path.exists(json_path):
+        # Mở thẳng file - không có file thì trả về rỗng (không cần exists() riêng)
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                content = f.read()
+        except FileNotFoundError:
             return []
         
-        with open(json_path, 'r', encoding='utf-8') as f:
-            api_data = json.load(f)
+        # List JSON [{name: key}, ...] hoặc JSONL (mỗi dòng một {name: key})
+        if content.lstrip().startswith('{'):
+            api_data = [json.loads(line) for line in content.splitlines() if line.strip()]
+        else:
+            api_data = json.loads(content)
         
         keys = []
         for item in api_data:
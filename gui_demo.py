@@ -58,10 +58,20 @@ import subprocess
 import time  
 from typing import Tuple
 from banner.banner import add_video_banner
+from source_text import X264_VIDEO_CODEC_ARGS
 import threading
+import queue
 import sys
 import json
+import traceback
 import os
+import shutil
+import tempfile
+import textwrap
+from functools import lru_cache
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 import re
 # Thêm vào phần import ở đầu file gui_demo.py
 import time
@@ -75,12 +85,17 @@ try:
         extract_source_from_filename,
         validate_font_file,
         get_plus_jakarta_font_path,
-        add_source_text_to_video
+        add_source_text_to_video,
+        HW_VIDEO_CODEC_ARGS,
+        detect_hwaccel
     )
     SOURCE_TEXT_AVAILABLE = True
     print("✅ Source text module loaded successfully")
 except ImportError as e:
     SOURCE_TEXT_AVAILABLE = False
+    # Bảng encoder GPU nằm trong source_text - không có module thì chỉ encode bằng libx264
+    HW_VIDEO_CODEC_ARGS = {}
+    detect_hwaccel = None
     print("f⚠️ Warning: Source text module not found: {str(e)}")
 try:
     from gg_api.get_subtitle import fix_srt_timestamps
@@ -96,19 +111,36 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
     print(f"✅ Added to Python path: {current_dir}")
 
+def _resolve_ffmpeg_tool(name: str) -> str:
+    """Bản đi kèm ứng dụng (ffmpeg/bin/<name>.exe) nếu có, không thì bản trong PATH"""
+    bundled = os.path.join(current_dir, "ffmpeg", "bin", f"{name}.exe")
+    if os.path.exists(bundled):
+        return bundled
+    return shutil.which(name) or bundled
+
+# Đường dẫn FFmpeg - resolve một lần khi load module, mọi chỗ gọi FFmpeg đều dùng hai hằng này
+FFMPEG_PATH = _resolve_ffmpeg_tool("ffmpeg")
+FFMPEG_AVAILABLE = os.path.exists(FFMPEG_PATH)
+FFPROBE_PATH = _resolve_ffmpeg_tool("ffprobe")
+FFPROBE_AVAILABLE = os.path.exists(FFPROBE_PATH)
+
+# File dữ liệu JSON trong gg_api/
+API_KEY_JSON_PATH = os.path.join(current_dir, "gg_api", "api_key.json")
+VOICE_JSON_PATH = os.path.join(current_dir, "gg_api", "voice_info.json")
+
 from PyQt5.QtCore import QTimer
 from PyQt5.QtCore import QRect
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                             QHBoxLayout, QGridLayout, QTabWidget, QGroupBox,
                             QPushButton, QLabel, QLineEdit, QTextEdit, 
-                            QProgressBar, QListWidget, QCheckBox, QSpinBox,
+                            QProgressBar, QListWidget, QListView, QCheckBox, QSpinBox,
                             QComboBox, QFileDialog, QSplitter, QFrame,
                             QScrollArea, QSlider, QDoubleSpinBox, QTextBrowser,
                             QListWidgetItem, QHeaderView, QTableWidget, QTableWidgetItem,
                             QRadioButton)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize
-from PyQt5.QtGui import QFont, QPixmap, QPalette, QColor, QPainter, QPen, QBrush
+from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QObject, QRunnable, QThreadPool, QSignalBlocker, QStringListModel, QSortFilterProxyModel, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QFont, QPixmap, QPalette, QColor, QPainter, QPen, QBrush, QStandardItemModel, QStandardItem, QTextCursor, QTextCharFormat
 
 try:
     from gg_api.test_api import test_api_key as test_key_function
@@ -122,6 +154,345 @@ except Exception as e:
     API_TESTING_AVAILABLE = False
     print(f"❌ Error loading API testing module: {str(e)}")
 
+try:
+    from gg_api.get_subtitle import (
+        process_video_for_subtitles as api_process_video,
+        get_default_words_per_line
+    )
+    print("✅ Subtitle API module loaded successfully")
+except ImportError as e:
+    api_process_video = None
+    get_default_words_per_line = None
+    print(f"⚠️ Warning: Subtitle API module not found: {str(e)}")
+
+# orjson parse nhanh hơn json chuẩn nhiều lần - dùng nếu đã cài, không thì fallback.
+# Cả hai đều nhận bytes nên file JSON được đọc ở mode 'rb' (bỏ qua lớp decode text).
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# ijson stream từng phần tử của api_key.json thay vì dựng cả list trong bộ nhớ (pool lớn)
+try:
+    import ijson
+    API_KEY_PARSE_ERRORS = (json.JSONDecodeError, ijson.JSONError)
+except ImportError:
+    ijson = None
+    API_KEY_PARSE_ERRORS = (json.JSONDecodeError,)
+
+# PyAV đọc kích thước video ngay trong process - không cần spawn ffprobe
+try:
+    import av
+    AV_AVAILABLE = True
+except ImportError:
+    AV_AVAILABLE = False
+
+# Số key tối đa hiển thị trong dropdown - dừng đọc file khi đủ
+MAX_VISIBLE_API_KEYS = 500
+
+# Danh sách ngôn ngữ cho source_lang / target_lang (source_lang có thêm Auto Detect ở đầu).
+# Intern để các lần so sánh / tra dict theo tên ngôn ngữ trong batch dùng chung một object.
+AUTO_DETECT_LANGUAGE = sys.intern("🔍 Auto Detect")
+LANGUAGES = tuple(map(sys.intern, (
+    # === ALPHABETICAL ORDER ===
+    "🇦🇱 Albanian",
+    "🇸🇦 Arabic",
+    "🇦🇪 Arabic (UAE)",
+    "🇪🇬 Arabic (Egypt)",
+    "🇦🇷 Argentina (Spanish)",
+    "🇧🇩 Bengali",
+    "🇧🇦 Bosnian",
+    "🇧🇷 Brazil (Portuguese)",
+    "🇧🇬 Bulgarian",
+    "🇪🇸 Catalan",
+    "🇨🇱 Chile (Spanish)",
+    "🇨🇳 Chinese (Simplified)",
+    "🇹🇼 Chinese (Traditional)",
+    "🇨🇴 Colombia (Spanish)",
+    "🇭🇷 Croatian",
+    "🇨🇿 Czech Republic",
+    "🇩🇰 Danish",
+    "🇳🇱 Dutch",
+    "🇺🇸 English (US)",
+    "🇬🇧 English (UK)",
+    "🇨🇦 English (Canada)",
+    "🇦🇺 English (Australia)",
+    "🇳🇿 English (New Zealand)",
+    "🇮🇪 English (Ireland)",
+    "🇿🇦 English (South Africa)",
+    "🇪🇪 Estonian",
+    "🇵🇭 Filipino",
+    "🇫🇮 Finnish",
+    "🇫🇷 French",
+    "🇩🇪 German",
+    "🇬🇷 Greece",
+    "🇮🇳 Gujarati",
+    "🇮🇱 Hebrew",
+    "🇮🇳 Hindi",
+    "🇭🇺 Hungary",
+    "🇮🇩 Indonesian",
+    "🇮🇹 Italian",
+    "🇯🇵 Japanese",
+    "🇮🇳 Kannada",
+    "🇰🇷 Korean",
+    "🇱🇻 Latvia",
+    "🇱🇹 Lithuania",
+    "🇲🇰 Macedonian",
+    "🇲🇾 Malay",
+    "🇮🇳 Malayalam",
+    "🇮🇳 Marathi",
+    "🇲🇽 Mexico (Spanish)",
+    "🇳🇴 Norwegian",
+    "🇮🇷 Persian",
+    "🇵🇪 Peru (Spanish)",
+    "🇵🇱 Polish",
+    "🇵🇹 Portuguese",
+    "🇷🇴 Romania",
+    "🇷🇺 Russian",
+    "🇷🇸 Serbia",
+    "🇸🇰 Slovakia",
+    "🇸🇮 Slovenia",
+    "🇪🇸 Spanish",
+    "🇸🇪 Swedish",
+    "🇮🇳 Tamil",
+    "🇮🇳 Telugu",
+    "🇹🇭 Thai",
+    "🇹🇷 Turkish",
+    "🇺🇦 Ukrainian",
+    "🇵🇰 Urdu",
+    "🇻🇪 Venezuela (Spanish)",
+    "🇻🇳 Vietnamese",
+)))
+
+# Màu chromakey: (label trong chroma_color, giá trị truyền cho FFmpeg)
+CHROMA_COLORS = (
+    ("Green (0x00ff00)", "0x00ff00"),
+    ("Blue (0x0000ff)", "0x0000ff"),
+    ("Black (0x000000)", "0x000000"),
+    ("White (0xffffff)", "0xffffff"),
+    ("Red (0xff0000)", "0xff0000"),
+)
+
+# Spinbox điều khiển vị trí trên preview - valueChanged được nối tới _schedule_preview_update
+PREVIEW_SPINBOX_NAMES = ("banner_x", "banner_y", "banner_height_ratio", "subtitle_y", "source_x", "source_y")
+
+# Separator giữa các block SRT (một hoặc nhiều dòng trống)
+SRT_BLOCK_SEPARATOR_RE = re.compile(r'\n\s*\n')
+
+# Thời gian (giây) giữ kết quả validate API key trước khi kiểm tra lại
+API_KEY_VALIDATION_TTL = 300
+
+# Số video xử lý song song (mỗi lane một SingleAPIWorker, key 1/key 2 xen kẽ).
+# Mỗi lane đã chạy FFmpeg đa luồng nên chỉ dùng khoảng nửa số core, tối thiểu 2 như trước.
+MAX_PARALLEL_WORKERS = max(2, (os.cpu_count() or 2) // 2)
+
+# Các extension video được hỗ trợ khi quét folder (add_folder)
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v'})
+
+# Log: số dòng tối đa chờ flush, chu kỳ flush (ms), số block tối đa giữ trong log_text
+LOG_BUFFER_SIZE = 10000
+LOG_FLUSH_INTERVAL_MS = 100
+LOG_MAX_BLOCKS = 5000
+
+# Tham số encode video mặc định (CPU) là X264_VIDEO_CODEC_ARGS của source_text; audio luôn được copy.
+# -threads được thêm theo từng batch (xem _ffmpeg_threads_for / _encode_video_args)
+
+def _ffmpeg_threads_for(worker_count: int) -> int:
+    """Số thread FFmpeg cho mỗi lane khi worker_count lane chạy song song - các lane không tranh core"""
+    return max(1, (os.cpu_count() or 2) // max(1, worker_count))
+
+def _stat_or_none(path: str):
+    """Trả về os.stat_result của path, hoặc None nếu file không tồn tại"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+# Cache kích thước video trên đĩa: {path: [mtime_ns, size, width, height]} - xem get_video_dimensions
+PROBE_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".pedit", "probe_cache.json")
+
+def _probe_dimensions(video_path: str) -> tuple[int, int]:
+    """
+    Đọc (width, height) của video: PyAV trước, ffprobe sau. Không đụng GUI nên gọi được từ thread khác.
+    Raises: RuntimeError kèm thông báo lỗi nếu không đọc được
+    """
+    if AV_AVAILABLE:
+        # Đọc header bằng PyAV; lỗi thì fallback sang ffprobe bên dưới
+        try:
+            with av.open(video_path) as container:
+                codec_context = container.streams.video[0].codec_context
+                width, height = codec_context.width, codec_context.height
+            if width and height:
+                return width, height
+        except Exception:
+            pass
+    
+    if not FFPROBE_AVAILABLE:
+        raise RuntimeError(f"FFprobe not found: {FFPROBE_PATH}")
+    
+    probe_cmd = [
+        FFPROBE_PATH,
+        "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=width,height",
+        "-of", "json",
+        video_path
+    ]
+    
+    # stdout giữ dạng bytes - _json_loads (orjson/json) nhận trực tiếp
+    result = subprocess.run(probe_cmd, capture_output=True, timeout=10)
+    if result.returncode != 0:
+        raise RuntimeError(f"FFprobe error: {result.stderr.decode('utf-8', errors='replace')}")
+    
+    try:
+        stream = _json_loads(result.stdout)["streams"][0]
+        return int(stream["width"]), int(stream["height"])
+    except (ValueError, KeyError, IndexError, TypeError):
+        raise RuntimeError(f"Cannot parse dimensions: {result.stdout[:200]!r}")
+
+def _load_probe_cache() -> dict:
+    """Đọc PROBE_CACHE_PATH thành {(path, mtime_ns, size): (width, height)}; file hỏng/không có thì trả về {}"""
+    try:
+        with open(PROBE_CACHE_PATH, 'rb') as f:
+            entries = _json_loads(f.read())
+        return {(path, mtime_ns, size): (width, height)
+                for path, (mtime_ns, size, width, height) in entries.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+def _mask_api_key(api_key: str) -> str:
+    """Che phần giữa của API key để hiển thị trên GUI/log"""
+    return f"{api_key[:10]}...{api_key[-4:]}"
+
+# Số request Gemini chạy cùng lúc tối đa trên MỘT API key - các lane dư chờ slot thay vì dính rate limit
+MAX_CONCURRENT_CALLS_PER_KEY = 2
+_api_key_semaphores = {}
+_api_key_semaphores_lock = threading.Lock()
+
+def _api_key_slot(api_key: str) -> threading.BoundedSemaphore:
+    """Semaphore giới hạn số request đồng thời của api_key (dùng: with _api_key_slot(key): ...)"""
+    with _api_key_semaphores_lock:
+        semaphore = _api_key_semaphores.get(api_key)
+        if semaphore is None:
+            semaphore = _api_key_semaphores[api_key] = threading.BoundedSemaphore(MAX_CONCURRENT_CALLS_PER_KEY)
+        return semaphore
+
+# Kích thước tham chiếu của GUI (9:16) - tọa độ trên GUI được scale theo video thực tế
+REFERENCE_WIDTH = 1080
+REFERENCE_HEIGHT = 1920
+
+@dataclass
+class BannerState:
+    """Bản sao Python của các spinbox banner - cập nhật qua valueChanged (xem _bind_banner_state)"""
+    x: int = 250
+    y: int = 1550
+    ratio: float = 0.6
+    start: int = 0
+    end: int = 60
+
+@lru_cache(maxsize=64)
+def _banner_geometry(video_width: int, video_height: int, gui_x: int, gui_y: int, gui_height_ratio: float):
+    """
+    Phần tính toán thuần của banner params (không đụng GUI/log).
+    Cache theo tham số: batch thường chỉ có vài độ phân giải nên mỗi độ phân giải chỉ tính một lần.
+    Returns: (final_x, final_y, banner_width, banner_height, width_adjusted)
+    """
+    # Position mapping
+    actual_x = int(gui_x * (video_width / REFERENCE_WIDTH))
+    actual_y = int(gui_y * (video_height / REFERENCE_HEIGHT))
+    
+    # Banner size calculations - 16:9 aspect ratio
+    banner_height = int(video_height * gui_height_ratio)
+    banner_width = int(banner_height * 16/9)
+    
+    # Boundary checks
+    width_adjusted = banner_width > video_width
+    if width_adjusted:
+        banner_width = int(video_width * 0.9)
+        banner_height = int(banner_width * 9/16)
+    
+    # Position clamping
+    final_x = max(0, min(actual_x, video_width - banner_width))
+    final_y = max(0, min(actual_y, video_height - banner_height))
+    return final_x, final_y, banner_width, banner_height, width_adjusted
+
+@lru_cache(maxsize=64)
+def _source_geometry(video_width: int, video_height: int, gui_x: int, gui_y: int, gui_font_size: int):
+    """
+    Phần tính toán thuần của source text params (không đụng GUI/log), cache giống _banner_geometry.
+    Returns: (final_x, final_y, font_size, width_scale, height_scale, font_scale)
+    """
+    width_scale = video_width / REFERENCE_WIDTH
+    height_scale = video_height / REFERENCE_HEIGHT
+    
+    # Scale position
+    actual_x = int(gui_x * width_scale)
+    actual_y = int(gui_y * height_scale)
+    
+    # Scale font size (use minimum scale to maintain readability)
+    font_scale = min(width_scale, height_scale)
+    actual_font_size = max(8, int(gui_font_size * font_scale))  # Minimum 8px
+    
+    # Boundary checks - ensure text doesn't go off screen
+    text_width_estimate = len("Source: Example Text") * actual_font_size * 0.6  # Rough estimation
+    max_x = max(0, video_width - int(text_width_estimate))
+    max_y = max(actual_font_size, video_height - actual_font_size)  # Keep within bounds
+    
+    final_x = max(0, min(actual_x, max_x))
+    final_y = max(actual_font_size, min(actual_y, max_y))
+    return final_x, final_y, actual_font_size, width_scale, height_scale, font_scale
+
+def _is_jsonl_file(f) -> bool:
+    """True nếu file (mở mode 'rb') bắt đầu bằng '{' - tức JSONL thay vì list JSON. Đưa con trỏ về đầu file"""
+    first = f.read(1)
+    while first.isspace():
+        first = f.read(1)
+    f.seek(0)
+    return first == b'{'
+
+# Emoji theo giới tính của voice - key là _gender_key (chuẩn hóa khi load voice_info.json)
+GENDER_EMOJI = {
+    "Nữ|Nam": "⚧️",  # Unisex voice
+    "Nữ": "♀️",      # Female voice
+    "Nam": "♂️",     # Male voice
+}  # Không khớp -> "⚪" (unknown gender)
+
+def _gender_key(gender: str) -> str:
+    """Chuẩn hóa trường "Inferred Gender" thành key của GENDER_EMOJI ("" nếu không xác định)"""
+    female, male = "Nữ" in gender, "Nam" in gender
+    if female and male:
+        return "Nữ|Nam"
+    return "Nữ" if female else ("Nam" if male else "")
+
+@lru_cache(maxsize=1)
+def _load_voice_data_cached(mtime_ns: int):
+    """
+    Parse voice_info.json một lần cho mỗi mtime_ns (đổi mtime -> đọc lại).
+    Trả về (voice_data, voice_index) với voice_index = {Voice Name: voice}
+    """
+    with open(VOICE_JSON_PATH, 'rb') as f:
+        voice_data = _json_loads(f.read())
+    for voice in voice_data:
+        voice["_gender_key"] = _gender_key(voice.get("Inferred Gender", ""))
+    return voice_data, {voice.get("Voice Name"): voice for voice in voice_data}
+
+def _write_text_atomic(path: str, content: str):
+    """Ghi file qua một file tạm (mkstemp, cùng thư mục) rồi os.replace để không bao giờ để lại file ghi dở"""
+    # Tên tạm riêng cho mỗi lần ghi - hai thread ghi cùng path không đè file tạm của nhau
+    fd, tmp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                    dir=os.path.dirname(path) or None)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 class SimpleSpinner(QLabel):
     """Simple rotating spinner using text characters"""
     
@@ -160,6 +531,160 @@ class SimpleSpinner(QLabel):
         self.setText(self.spinner_chars[self.current_index])
         self.current_index = (self.current_index + 1) % len(self.spinner_chars)
 
+class SkipFirstRowProxyModel(QSortFilterProxyModel):
+    """Proxy ẩn dòng đầu của source model (dùng cho target_lang: bỏ Auto Detect)"""
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        return source_row > 0
+
+class VoiceListModel(QAbstractListModel):
+    """
+    Model cho voice_combo, dùng trực tiếp list từ voice_info.json.
+    Display text chỉ được format cho các dòng view thực sự yêu cầu.
+    """
+    
+    def __init__(self, voices, parent=None):
+        super().__init__(parent)
+        self._voices = voices
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._voices)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        voice = self._voices[index.row()]
+        if role == Qt.DisplayRole:
+            return (f"{GENDER_EMOJI.get(voice.get('_gender_key', ''), '⚪')} "
+                    f"{voice.get('Voice Name', 'Unknown')} - {voice.get('Characteristic', '')}")
+        if role == Qt.UserRole:
+            return voice.get("Voice Name", "Unknown")
+        return None
+
+class FileListModel(QAbstractListModel):
+    """
+    Model cho file_list / queue_list: path và status lưu ở hai list song song,
+    text hiển thị "<status> <path>" chỉ được format khi view yêu cầu.
+    Qt.UserRole trả về path đầy đủ.
+    """
+    
+    def __init__(self, default_status="📹", show_basename=False, parent=None):
+        super().__init__(parent)
+        self._paths = []
+        self._statuses = []
+        self._default_status = default_status
+        self._show_basename = show_basename
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            path = self._paths[row]
+            return f"{self._statuses[row]} {os.path.basename(path) if self._show_basename else path}"
+        if role == Qt.UserRole:
+            return self._paths[row]
+        return None
+    
+    def paths(self) -> list:
+        return list(self._paths)
+    
+    def add_paths(self, paths):
+        """Thêm nhiều path trong một lần beginInsertRows/endInsertRows"""
+        if not paths:
+            return
+        first = len(self._paths)
+        self.beginInsertRows(QModelIndex(), first, first + len(paths) - 1)
+        self._paths.extend(paths)
+        self._statuses.extend([self._default_status] * len(paths))
+        self.endInsertRows()
+    
+    def set_paths(self, paths):
+        """Thay toàn bộ danh sách (một lần reset model)"""
+        self.beginResetModel()
+        self._paths = list(paths)
+        self._statuses = [self._default_status] * len(self._paths)
+        self.endResetModel()
+    
+    def clear(self):
+        self.set_paths([])
+    
+    def set_status(self, row: int, status: str):
+        """Đổi status một dòng - chỉ dòng đó được vẽ lại"""
+        if 0 <= row < len(self._statuses):
+            self._statuses[row] = status
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+class ApiTestSignals(QObject):
+    """Signals của ApiTestWorker (QRunnable không tự có signal)"""
+    finished = pyqtSignal(int, object)  # (api_number, results_dict)
+
+class ApiTestWorker(QRunnable):
+    """
+    Test một API key trong QThreadPool để network I/O (tối đa ~10 giây) không làm đơ GUI.
+    Kết quả được trả về GUI thread qua signals.finished.
+    """
+    
+    def __init__(self, api_number: int, api_key: str):
+        super().__init__()
+        self.api_number = api_number
+        self.api_key = api_key
+        self.signals = ApiTestSignals()
+    
+    def run(self):
+        try:
+            results = test_key_function(self.api_key)
+        except Exception as e:
+            results = {"success": False, "message": f"❌ Test failed: {str(e)}"}
+        self.signals.finished.emit(self.api_number, results)
+
+class EncoderProbeSignals(QObject):
+    """Signals của EncoderProbeWorker"""
+    finished = pyqtSignal(object)  # tên encoder phần cứng | None
+
+class EncoderProbeWorker(QRunnable):
+    """Chạy detect_hwaccel của source_text (vài lần spawn FFmpeg) trong QThreadPool thay vì trên GUI thread"""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = EncoderProbeSignals()
+    
+    def run(self):
+        if not FFMPEG_AVAILABLE or detect_hwaccel is None:
+            self.signals.finished.emit(None)
+            return
+        self.signals.finished.emit(detect_hwaccel(FFMPEG_PATH))
+
+class VoiceLoadSignals(QObject):
+    """Signals của VoiceLoadWorker"""
+    finished = pyqtSignal(object, object)  # ((mtime_ns, voice_data, voice_index) | None, error_message | None)
+
+class VoiceLoadWorker(QRunnable):
+    """Đọc + parse voice_info.json trong QThreadPool để không block GUI khi dựng panel"""
+    
+    def __init__(self):
+        super().__init__()
+        self.signals = VoiceLoadSignals()
+    
+    def run(self):
+        try:
+            mtime = os.stat(VOICE_JSON_PATH).st_mtime_ns
+            voice_data, voice_index = _load_voice_data_cached(mtime)
+            self.signals.finished.emit((mtime, voice_data, voice_index), None)
+        except FileNotFoundError:
+            self.signals.finished.emit(None, "❌ voice_info.json not found")
+        except ValueError:
+            self.signals.finished.emit(None, "❌ Error parsing voice_info.json")
+        except OSError as e:
+            self.signals.finished.emit(None, f"❌ Cannot read voice_info.json: {e}")
+        except Exception as e:
+            # Exception không được thoát khỏi QRunnable.run (PyQt5 abort) - JSON sai cấu trúc, v.v.
+            self.signals.finished.emit(None, f"❌ Invalid voice_info.json: {e}")
+
 class SingleAPIWorker(QThread):
     """
     🔥 NEW: Isolated worker for single API processing
@@ -321,7 +846,6 @@ class SingleAPIWorker(QThread):
                     return False, ""
             else:
                 # No source text - copy current video to final
-                import shutil
                 shutil.copy2(current_video, final_output)
             
             # PROGRESS: 95%
@@ -353,21 +877,24 @@ class SingleAPIWorker(QThread):
             
             self._log("INFO", f"🌐 Languages: {source_lang} → {target_lang}")
             
+            if api_process_video is None:
+                self._log("ERROR", "❌ Subtitle module not available")
+                return False, ""
+            
             # 🔥 ENHANCED: Retry logic with different approaches
             max_retries = 3
             for attempt in range(max_retries):
                 try:
-                    from gg_api.get_subtitle import process_video_for_subtitles
-                    
-                    success, srt_content, message = process_video_for_subtitles(
-                        video_path=video_path,
-                        api_key=self.api_key,
-                        source_lang=source_lang,
-                        target_lang=target_lang,
-                        words_per_line=8,
-                        ffmpeg_path=None,
-                        log_callback=lambda level, msg: self._log(level, msg)
-                    )
+                    with _api_key_slot(self.api_key):
+                        success, srt_content, message = api_process_video(
+                            video_path=video_path,
+                            api_key=self.api_key,
+                            source_lang=source_lang,
+                            target_lang=target_lang,
+                            words_per_line=8,
+                            ffmpeg_path=None,
+                            log_callback=lambda level, msg: self._log(level, msg)
+                        )
                     
                     if success and srt_content:
                         break  # Success, exit retry loop
@@ -386,7 +913,6 @@ class SingleAPIWorker(QThread):
                     self._log("ERROR", f"🔄 Attempt {attempt+1} exception: {str(e)}")
                     
                 if attempt < max_retries - 1:
-                    import time
                     time.sleep(2)  # Wait before retry
             
             if not success:
@@ -447,13 +973,11 @@ class SingleAPIWorker(QThread):
             
             # Determine source text
             if settings.get('source_mode_filename', False):
-                from source_text import extract_source_from_filename
                 source_text = extract_source_from_filename(base_name)
             else:
                 source_text = settings.get('source_text', '@YourChannel')
             
             # Add source text
-            from source_text import add_source_text_to_video
             success, message = add_source_text_to_video(
                 input_video_path=input_video,
                 output_video_path=output_video,
@@ -461,7 +985,12 @@ class SingleAPIWorker(QThread):
                 position_x=source_params['position_x'],
                 position_y=source_params['position_y'],
                 font_size=source_params['font_size'],
-                font_color=source_params['font_color']
+                font_color=source_params['font_color'],
+                ffmpeg_executable=FFMPEG_PATH,
+                hwaccel=self.main_window._source_hwaccel,
+                threads=self.main_window._ffmpeg_threads,
+                video_width=video_width,  # đã có trong cache của main window - không ffprobe lần nữa
+                video_height=video_height
             )
             
             return success
@@ -500,11 +1029,9 @@ class ProcessingWorker(QThread):
         self.settings = {}
         self.should_stop = False
         
-        # 🔥 FIXED: Proper thread management
-        self.api_worker_1 = None
-        self.api_worker_2 = None
-        self.worker1_thread = None
-        self.worker2_thread = None
+        # 🔥 FIXED: Proper thread management - mỗi lane một SingleAPIWorker + một thread
+        self.api_workers = []
+        self.worker_threads = []
         self.completed_videos = 0
         self.total_videos = 0
         self.progress_lock = threading.Lock()  # Thread safety
@@ -522,30 +1049,27 @@ class ProcessingWorker(QThread):
         """Stop all workers gracefully"""
         self.should_stop = True
         
-        if self.api_worker_1 and self.api_worker_1.isRunning():
-            self.api_worker_1.stop_processing()
-            self.api_worker_1.wait(3000)
-        
-        if self.api_worker_2 and self.api_worker_2.isRunning():
-            self.api_worker_2.stop_processing()
-            self.api_worker_2.wait(3000)
+        for worker in self.api_workers:
+            if worker.isRunning():
+                worker.stop_processing()
+                worker.wait(3000)
     
-    def setup_isolated_workers(self, api_key_1: str, api_key_2: str):
-        """Setup 2 completely isolated API workers"""
+    def setup_isolated_workers(self, api_key_1: str, api_key_2: str, worker_count: int):
+        """Setup worker_count isolated API workers - key 1 / key 2 xen kẽ giữa các lane"""
         try:
-            self.api_worker_1 = SingleAPIWorker("Worker-1", api_key_1, self.parent)
-            self.api_worker_2 = SingleAPIWorker("Worker-2", api_key_2, self.parent)
-            
-            # Connect signals but handle progress differently
-            self.api_worker_1.worker_log.connect(self.on_worker_log)
-            self.api_worker_1.worker_finished.connect(self.on_worker_finished)
-            
-            self.api_worker_2.worker_log.connect(self.on_worker_log)
-            self.api_worker_2.worker_finished.connect(self.on_worker_finished)
+            api_keys = (api_key_1, api_key_2)
+            self.api_workers = []
+            for i in range(worker_count):
+                worker = SingleAPIWorker(f"Worker-{i + 1}", api_keys[i % 2], self.parent)
+                # Connect signals but handle progress differently
+                # Log: DirectConnection - chạy ngay trên thread worker, add_log chỉ append vào deque
+                worker.worker_log.connect(self.on_worker_log, Qt.DirectConnection)
+                worker.worker_finished.connect(self.on_worker_finished)
+                self.api_workers.append(worker)
             
             self.log_message.emit("SUCCESS", f"✅ ISOLATED workers created:")
-            self.log_message.emit("INFO", f"   🔑 Worker-1: {api_key_1[:10]}...{api_key_1[-4:]}")
-            self.log_message.emit("INFO", f"   🔑 Worker-2: {api_key_2[:10]}...{api_key_2[-4:]}")
+            for worker in self.api_workers:
+                self.log_message.emit("INFO", f"   🔑 {worker.worker_id}: {_mask_api_key(worker.api_key)}")
             
             return True
             
@@ -574,49 +1098,38 @@ class ProcessingWorker(QThread):
         try:
             # Setup workers
             api_key_1, api_key_2 = self.parent.get_dual_api_keys()
-            if not self.setup_isolated_workers(api_key_1, api_key_2):
+            worker_count = min(MAX_PARALLEL_WORKERS, max(1, len(self.files_to_process)))
+            if not self.setup_isolated_workers(api_key_1, api_key_2, worker_count):
                 return
+            # Chia core theo số lane thật của batch này (1 video -> 1 lane dùng toàn bộ core)
+            self.parent._ffmpeg_threads = _ffmpeg_threads_for(worker_count)
             
-            # 🔥 STRATEGY: Split videos evenly
-            if len(self.files_to_process) == 1:
-                # Single video - use worker 1 only
-                worker1_videos = self.files_to_process
-                worker2_videos = []
-            else:
-                # Multiple videos - distribute evenly
-                mid_point = len(self.files_to_process) // 2
-                worker1_videos = self.files_to_process[:mid_point]
-                worker2_videos = self.files_to_process[mid_point:]
-            
-            self.log_message.emit("INFO", f"🔄 TRUE PARALLEL SPLIT:")
-            self.log_message.emit("INFO", f"   Worker-1: {len(worker1_videos)} videos")
-            self.log_message.emit("INFO", f"   Worker-2: {len(worker2_videos)} videos")
-            
-            # 🔥 Start both workers in TRUE parallel threads
-            self.worker1_thread = threading.Thread(
-                target=self._process_video_list,
-                args=(self.api_worker_1, worker1_videos, "Worker-1"),
-                daemon=True
-            )
+            # 🔥 STRATEGY: Các lane cùng lấy video từ một queue - lane nào rảnh lấy video tiếp theo
+            video_queue = queue.SimpleQueue()
+            for video_path in self.files_to_process:
+                video_queue.put(video_path)
             
-            if worker2_videos:  # Only start worker 2 if it has videos
-                self.worker2_thread = threading.Thread(
+            self.log_message.emit("INFO", f"🔄 TRUE PARALLEL: {len(self.api_workers)} workers, {len(self.files_to_process)} videos")
+            
+            # 🔥 Start all workers in TRUE parallel threads
+            self.worker_threads = [
+                threading.Thread(
                     target=self._process_video_list,
-                    args=(self.api_worker_2, worker2_videos, "Worker-2"),
+                    args=(worker, video_queue, worker.worker_id),
                     daemon=True
                 )
+                for worker in self.api_workers
+            ]
             
-            # 🔥 START BOTH SIMULTANEOUSLY
-            self.worker1_thread.start()
-            if self.worker2_thread:
-                self.worker2_thread.start()
+            # 🔥 START ALL SIMULTANEOUSLY
+            for worker_thread in self.worker_threads:
+                worker_thread.start()
             
-            self.log_message.emit("SUCCESS", "🚀 Both workers started in TRUE PARALLEL mode!")
+            self.log_message.emit("SUCCESS", f"🚀 {len(self.worker_threads)} workers started in TRUE PARALLEL mode!")
             
-            # 🔥 WAIT FOR BOTH TO COMPLETE
-            self.worker1_thread.join()
-            if self.worker2_thread:
-                self.worker2_thread.join()
+            # 🔥 WAIT FOR ALL TO COMPLETE
+            for worker_thread in self.worker_threads:
+                worker_thread.join()
             
             # Final status
             self.log_message.emit("SUCCESS", f"🎉 TRUE PARALLEL processing completed!")
@@ -625,20 +1138,25 @@ class ProcessingWorker(QThread):
         except Exception as e:
             self.log_message.emit("ERROR", f"❌ Parallel coordinator error: {str(e)}")
             self.processing_finished.emit(False)
+        finally:
+            # Ngoài batch (preview, xử lý lẻ) FFmpeg lại dùng số thread mặc định
+            self.parent._ffmpeg_threads = None
     
-    def _process_video_list(self, worker, video_list, worker_name):
-        """🔥 ENHANCED: Process list with detailed timing"""
+    def _process_video_list(self, worker, video_queue, worker_name):
+        """🔥 ENHANCED: Lấy video từ queue chung cho tới khi hết, with detailed timing"""
         try:
-            import time
-            
-            for i, video_path in enumerate(video_list):
-                if self.should_stop:
+            processed = 0
+            while not self.should_stop:
+                try:
+                    video_path = video_queue.get_nowait()
+                except queue.Empty:
                     break
+                processed += 1
                 
                 start_time = time.time()
                 video_name = os.path.basename(video_path)
                 
-                self.log_message.emit("INFO", f"📹 {worker_name} starting: {video_name} ({i+1}/{len(video_list)})")
+                self.log_message.emit("INFO", f"📹 {worker_name} starting: {video_name} (#{processed})")
                 
                 # Process video
                 if worker.assign_video(video_path, self.output_dir, self.settings):
@@ -870,12 +1388,78 @@ class VideoPreviewWidget(QLabel):
 class VideoEditorMainWindow(QMainWindow):
     """Main application window for video editing tool"""
     
+    # Stylesheet dựng sẵn cho từng trạng thái API (xem _update_api_status)
+    _STATUS_STYLES = {
+        "SUCCESS": "color: #16a34a; font-weight: bold;",
+        "ERROR": "color: #dc2626; font-weight: bold;",
+        "WARNING": "color: #d97706; font-weight: bold;",
+        "INFO": "color: #0ea5e9; font-weight: bold;",
+        "TESTING": "color: #d97706; font-weight: bold;"
+    }
+    _DEFAULT_STATUS_STYLE = "color: #6b7280; font-weight: bold;"
+    
+    # Thứ tự log level - level thấp hơn min_log_level bị bỏ qua (xem log_enabled)
+    _LOG_LEVEL_ORDER = {"DEBUG": 0, "INFO": 1, "SUCCESS": 1, "WARNING": 2, "ERROR": 3}
+    min_log_level = "DEBUG"  # mặc định hiện mọi log - đổi qua combo Log level trên tab Logs
+    
+    # Template log chi tiết banner - một lần format thay cho nhiều add_log (dòng nối bằng <br>)
+    _BANNER_CALC_LOG_TMPL = (
+        "   📐 Video: {video_width}x{video_height}<br>"
+        "   📏 Scale: {width_scale:.3f}x, {height_scale:.3f}x<br>"
+        "   📍 Position: ({gui_x}, {gui_y}) → ({position_x}, {position_y})<br>"
+        "   📐 Banner: {banner_width}x{banner_height} ({ratio_percent:.1f}%)"
+    )
+    _BANNER_FFMPEG_LOG_TMPL = (
+        "🎬 Final FFmpeg parameters for {file_name}:<br>"
+        "   ➡️ Position: ({position_x}, {position_y})<br>"
+        "   ➡️ Banner Size: {banner_width}x{banner_height} pixels<br>"
+        "   ➡️ Chroma: {chroma_color}, Similarity: {similarity}<br>"
+        "   ➡️ Timing: {start_time}s to {end_time}s"
+    )
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Video Editor Tool - Batch Processing (9:16 Format)")
         self.setGeometry(100, 100, 1600, 1000)
         
         self.current_api_index = 0
+        self._validated_api_key = None  # (source, key, timestamp) - xem get_validated_api_key
+        self._api_keys_cache = None  # [(display_text, api_key), ...] - xem _parse_api_keys
+        self._api_keys_mtime = 0
+        self._api_slots = {}  # api_number -> widgets của API đó - xem setup_api_components
+        self._voice_index = {}  # Voice Name -> voice info - xem load_voice_data
+        self._voice_data_mtime = 0  # mtime của voice_info.json lần load đã log
+        # Widget source text - None cho tới khi create_preview_tab tạo widget
+        self.source_x = None
+        self.source_y = None
+        self.source_font_size = None
+        self.source_font_color = None
+        self.source_text = None
+        self._hw_encoder = None  # hwaccel dò được ("nvenc"/"qsv"/"amf") - xem check_ffmpeg_installation
+        self._source_hwaccel = None  # hwaccel cho add_source_text_to_video - xem _on_gpu_encode_toggled
+        self._video_codec_args = X264_VIDEO_CODEC_ARGS  # đổi sang HW_VIDEO_CODEC_ARGS khi bật GPU encoding
+        self._ffmpeg_threads = None  # -threads mỗi lane, ProcessingWorker đặt theo batch - None = mặc định FFmpeg
+        self._chroma_hex = CHROMA_COLORS[0][1]  # màu chromakey đang chọn - xem _get_chroma_color
+        self._banner_state = BannerState()  # giá trị banner hiện tại trên GUI
+        self._file_model = FileListModel(parent=self)  # file_list - path các video đã chọn
+        self._queue_model = FileListModel(default_status="⏳", show_basename=True, parent=self)  # queue_list
+        self._dim_cache = None  # (path, mtime_ns, size) -> (width, height), nạp lazy - xem _get_dim_cache
+        self._dim_cache_lock = threading.Lock()  # bảo vệ _dim_cache/_dim_cache_dirty giữa các thread probe
+        self._dim_cache_dirty = False  # có kết quả probe mới chưa lưu vào PROBE_CACHE_PATH
+        self._probe_executor = None  # ThreadPoolExecutor - xem prefetch_video_dimensions
+        # Log được gom vào buffer và flush định kỳ - xem add_log / _flush_logs
+        self._log_buffer = deque(maxlen=LOG_BUFFER_SIZE)
+        self._log_timer = QTimer(self)
+        self._log_timer.setInterval(LOG_FLUSH_INTERVAL_MS)
+        self._log_timer.timeout.connect(self._flush_logs)
+        self._log_timer.start()
+        # Debounce cập nhật preview khi spinbox thay đổi liên tục - xem _schedule_preview_update
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(30)
+        self._preview_timer.timeout.connect(self._update_preview_positions)
+        # Model ngôn ngữ dùng chung cho source_lang / target_lang
+        self._lang_model = QStringListModel([AUTO_DETECT_LANGUAGE, *LANGUAGES], self)
         
         # 🔥 THÊM BIẾN PROCESSING STATE
         self.is_processing = False
@@ -884,22 +1468,25 @@ class VideoEditorMainWindow(QMainWindow):
         self.processing_worker = ProcessingWorker(self)
         self.setup_worker_connections()
         
-        self.init_ui()
+        # Stylesheet đặt TRƯỚC khi dựng widget: mỗi widget được polish một lần lúc tạo,
+        # thay vì setStyleSheet sau init_ui làm Qt re-polish lại toàn bộ cây widget
         self.apply_modern_styles()
+        self.init_ui()
         
         # 🔥 THIẾT LẬP CÁC MẶC ĐỊNH SAU KHI UI ĐÃ TẠO
         self.setup_defaults()
         
-        # 🔥 KIỂM TRA FFMPEG KHI KHỞI ĐỘNG
-        QApplication.processEvents()  # Để UI load xong trước
-        self.check_ffmpeg_installation()
+        # 🔥 KIỂM TRA FFMPEG KHI KHỞI ĐỘNG - chạy khi event loop bắt đầu, sau khi UI đã hiện
+        QTimer.singleShot(0, self.check_ffmpeg_installation)
     
     def setup_worker_connections(self):
         """Kết nối signals từ worker thread tới main thread"""
         self.processing_worker.progress_updated.connect(self.update_overall_progress)
         self.processing_worker.current_file_updated.connect(self.update_current_file)
         self.processing_worker.current_step_updated.connect(self.update_current_step)
-        self.processing_worker.log_message.connect(self.add_log)
+        # add_log chỉ append vào _log_buffer (thread-safe) nên gọi trực tiếp từ thread worker,
+        # không cần post từng dòng log qua event queue của GUI thread - _flush_logs gom lại mỗi 100ms
+        self.processing_worker.log_message.connect(self.add_log, Qt.DirectConnection)
         self.processing_worker.queue_updated.connect(self.update_queue_item)
         self.processing_worker.processing_finished.connect(self.on_processing_finished)
 
@@ -922,11 +1509,7 @@ class VideoEditorMainWindow(QMainWindow):
 
     def update_queue_item(self, index, status):
         """Update queue item status"""
-        if hasattr(self, 'queue_list') and index < self.queue_list.count():
-            item = self.queue_list.item(index)
-            if item:
-                file_name = item.text().split(" ", 1)[-1] if " " in item.text() else item.text()
-                item.setText(f"{status} {file_name}")
+        self._queue_model.set_status(index, status)
 
     def on_processing_finished(self, success):
         """Called when processing is completely finished"""
@@ -940,8 +1523,6 @@ class VideoEditorMainWindow(QMainWindow):
     def wrap_text_for_safe_display(self, text: str, max_chars_per_line: int) -> str:
         """🔥 SIMPLE: Wrap text để fit TikTok safe area"""
         try:
-            import textwrap
-            
             # Clean text
             text = ' '.join(text.split())
             
@@ -1106,10 +1687,10 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         """
         self.add_log("INFO", "✅ Sử dụng cơ chế scale tự động của file .ASS.")
         try:
-            ffmpeg_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ffmpeg", "bin", "ffmpeg.exe")
-            if not os.path.exists(ffmpeg_path):
+            if not FFMPEG_AVAILABLE:
                 self.add_log("ERROR", "❌ FFmpeg executable not found")
                 return False
+            ffmpeg_path = FFMPEG_PATH
 
             # === BƯỚC 1: BỎ HOÀN TOÀN LOGIC MAPPING BẰNG TAY ===
             # Lấy giá trị gốc trực tiếp từ GUI. Các giá trị này dành cho canvas 1080x1920.
@@ -1132,9 +1713,10 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             style = self.subtitle_style.currentText()
             ass_content = self.create_ass_file_content(srt_content, font_size, margin_v, style)
 
-            # Lưu nội dung .ass vào một file tạm
-            temp_ass_path = os.path.join(os.path.dirname(srt_file), "temp_subtitles.ass")
-            with open(temp_ass_path, 'w', encoding='utf-8') as f:
+            # Lưu nội dung .ass vào một file tạm - tên riêng cho từng job vì các lane chạy song song
+            ass_fd, temp_ass_path = tempfile.mkstemp(prefix="temp_subtitles_", suffix=".ass",
+                                                     dir=os.path.dirname(srt_file) or None)
+            with os.fdopen(ass_fd, 'w', encoding='utf-8') as f:
                 f.write(ass_content)
 
             # Lệnh FFmpeg sử dụng file .ass tạm
@@ -1149,13 +1731,16 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             ]
 
             self.add_log("INFO", "🔧 FFmpeg subtitles command is being executed with .ass file...")
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=600, encoding='utf-8', errors='ignore')
-
-            # Xóa file tạm sau khi dùng
-            if os.path.exists(temp_ass_path):
-                os.remove(temp_ass_path)
+            try:
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=600, encoding='utf-8', errors='ignore')
+            finally:
+                # Xóa file tạm sau khi dùng (kể cả khi FFmpeg timeout)
+                try:
+                    os.remove(temp_ass_path)
+                except OSError:
+                    pass
             
-            if result.returncode == 0 and os.path.exists(output_video):
+            if result.returncode == 0 and _stat_or_none(output_video):
                 self.add_log("SUCCESS", "✅ Subtitles with AUTO-SCALING and centering added successfully!")
                 return True
             else:
@@ -1165,18 +1750,32 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
         except Exception as e:
             self.add_log("ERROR", f"❌ A critical error occurred in .ass subtitle addition: {str(e)}")
-            import traceback
-            self.add_log("ERROR", f"   Traceback: {traceback.format_exc()}")
+            self.add_log_exc("ERROR", "   Traceback: ")
             return False
     
     def get_validated_api_key(self) -> str:
+        """
+        Validate API key một lần cho cả batch - cache kết quả trong API_KEY_VALIDATION_TTL giây
+        """
+        api_key = self.api_key_input.text().strip()
+        pool_key = self.api_key_pool.currentData() if hasattr(self, 'api_key_pool') else None
+        cache_source = (api_key, pool_key)
+        
+        cached = self._validated_api_key
+        if cached and cached[0] == cache_source and time.time() - cached[2] < API_KEY_VALIDATION_TTL:
+            return cached[1]
+        
+        validated_key = self._validate_api_key(api_key)
+        self._validated_api_key = (cache_source, validated_key, time.time()) if validated_key else None
+        return validated_key
+
+    def _validate_api_key(self, api_key: str) -> str:
         """
         🔥 SỬA LẠI: Validate API key với debug chi tiết
         """
         self.add_log("INFO", "🔑 [API DEBUG] Starting API key validation...")
         
         # Get from manual input
-        api_key = self.api_key_input.text().strip()
         self.add_log("INFO", f"🔍 [API DEBUG] Manual input length: {len(api_key)}")
         
         if not api_key:
@@ -1205,7 +1804,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             self.add_log("WARNING", f"⚠️ [API DEBUG] API key doesn't start with 'AIza': {api_key[:10]}...")
             # Continue anyway, might still work
         
-        self.add_log("SUCCESS", f"✅ [API DEBUG] API key validated: {api_key[:10]}...{api_key[-4:]}")
+        self.add_log("SUCCESS", f"✅ [API DEBUG] API key validated: {_mask_api_key(api_key)}")
         return api_key
 
     def build_subtitle_filter(self, srt_file: str, font_size: int, pos_x: int, pos_y: int, style: str) -> str:
@@ -1240,10 +1839,6 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
     def add_subtitles_to_video_centered(self, input_video: str, srt_file: str, output_video: str) -> bool:
         """🔥 FIXED: Handle special characters + correct FFmpeg syntax - 3 fallback methods"""
         try:
-            import time
-            import tempfile
-            import shutil
-            
             # Validate inputs
             if not os.path.exists(input_video):
                 self.add_log("ERROR", f"❌ Input video not found: {input_video}")
@@ -1253,14 +1848,11 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 self.add_log("ERROR", f"❌ SRT file not found: {srt_file}")
                 return False
             
-            # FFmpeg path
-            ffmpeg_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ffmpeg", "bin", "ffmpeg.exe")
-            if not os.path.exists(ffmpeg_path):
-                system_ffmpeg = shutil.which("ffmpeg")
-                if not system_ffmpeg:
-                    self.add_log("ERROR", "❌ FFmpeg not found")
-                    return False
-                ffmpeg_path = system_ffmpeg
+            # FFmpeg path (đã resolve cả bản trong PATH - xem _resolve_ffmpeg_tool)
+            if not FFMPEG_AVAILABLE:
+                self.add_log("ERROR", "❌ FFmpeg not found")
+                return False
+            ffmpeg_path = FFMPEG_PATH
             
             # Get video dimensions
             video_width, video_height = self.get_video_dimensions(input_video)
@@ -1291,24 +1883,22 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             # 🔥 METHOD 1: Copy SRT to temp location with safe filename
             self.add_log("INFO", "🔄 METHOD 1: Safe temp file approach")
             
-            temp_dir = tempfile.gettempdir()
-            timestamp = str(int(time.time()))
-            safe_filename = f"temp_subtitle_{timestamp}.srt"
-            temp_srt_path = os.path.join(temp_dir, safe_filename)
+            # mkstemp: tên duy nhất cho từng job (các lane song song không ghi đè SRT của nhau)
+            srt_fd, temp_srt_path = tempfile.mkstemp(prefix="temp_subtitle_", suffix=".srt")
+            os.close(srt_fd)
+            safe_filename = os.path.basename(temp_srt_path)
             
             # Copy processed SRT to temp location
             shutil.copy2(safe_srt_file, temp_srt_path)
             self.add_log("INFO", f"🔧 Temp SRT: {safe_filename}")
             
+            escaped_srt_path = temp_srt_path.replace('\\', '/').replace(':', '\\:')
             cmd_basic = [
                 ffmpeg_path,
                 "-y",
                 "-i", input_video,
-                "-vf", f"subtitles={temp_srt_path}",
-                "-c:a", "copy", 
-                "-c:v", "libx264",
-                "-preset", "fast",
-                "-crf", "23",
+                "-vf", f"subtitles='{escaped_srt_path}'",
+                "-c:a", "copy", *self._encode_video_args(),
                 output_video
             ]
             
@@ -1321,7 +1911,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 pass
             
             if result.returncode == 0:
-                if os.path.exists(output_video) and os.path.getsize(output_video) > 1000:
+                output_stat = _stat_or_none(output_video)
+                if output_stat and output_stat.st_size > 1000:
                     self.add_log("SUCCESS", f"✅ METHOD 1 SUCCESS!")
                     # Clean up processed SRT
                     try:
@@ -1336,44 +1927,31 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             # 🔥 METHOD 2: Relative path in video directory
             self.add_log("INFO", "🔄 METHOD 2: Relative path approach")
             
-            video_dir = os.path.dirname(input_video)
-            simple_srt_name = "temp_sub.srt"
-            simple_srt_path = os.path.join(video_dir, simple_srt_name)
+            video_dir = os.path.dirname(os.path.abspath(input_video))
+            srt_fd, simple_srt_path = tempfile.mkstemp(prefix="temp_sub_", suffix=".srt", dir=video_dir)
+            os.close(srt_fd)
+            simple_srt_name = os.path.basename(simple_srt_path)
             
             # Copy SRT to video directory
             shutil.copy2(safe_srt_file, simple_srt_path)
             
-            # Change to video directory
-            original_cwd = os.getcwd()
-            
             try:
-                os.chdir(video_dir)
-                
+                # FFmpeg chạy với cwd=video_dir - KHÔNG os.chdir (đổi cwd của cả process, mọi lane)
                 cmd_relative = [
                     ffmpeg_path,
-                    "-y", 
+                    "-y",
                     "-i", os.path.basename(input_video),
                     "-vf", f"subtitles={simple_srt_name}",
-                    "-c:a", "copy",
-                    "-c:v", "libx264",
-                    "-preset", "fast", 
-                    "-crf", "23",
-                    os.path.basename(output_video)
+                    "-c:a", "copy", *self._encode_video_args(),
+                    os.path.abspath(output_video)
                 ]
                 
-                result2 = subprocess.run(cmd_relative, capture_output=True, text=True, timeout=600)
-                
-                # Always restore directory
-                os.chdir(original_cwd)
-                
-                # Clean up temp SRT
-                try:
-                    os.remove(simple_srt_path)
-                except:
-                    pass
+                result2 = subprocess.run(cmd_relative, capture_output=True, text=True, timeout=600,
+                                         cwd=video_dir)
                 
                 if result2.returncode == 0:
-                    if os.path.exists(output_video) and os.path.getsize(output_video) > 1000:
+                    output_stat = _stat_or_none(output_video)
+                    if output_stat and output_stat.st_size > 1000:
                         self.add_log("SUCCESS", f"✅ METHOD 2 SUCCESS!")
                         # Clean up processed SRT
                         try:
@@ -1384,12 +1962,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                         return True
                             
             except Exception as e:
-                # Always restore directory on exception
+                self.add_log("ERROR", f"❌ METHOD 2 exception: {str(e)}")
+            finally:
+                # Clean up temp SRT
                 try:
-                    os.chdir(original_cwd)
+                    os.remove(simple_srt_path)
                 except:
                     pass
-                self.add_log("ERROR", f"❌ METHOD 2 exception: {str(e)}")
             
             self.add_log("WARNING", f"⚠️ METHOD 2 failed")
             
@@ -1430,17 +2009,15 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                         "-y",
                         "-i", input_video,
                         "-vf", complete_filter,
-                        "-c:a", "copy",
-                        "-c:v", "libx264", 
-                        "-preset", "fast",
-                        "-crf", "23",
+                        "-c:a", "copy", *self._encode_video_args(),
                         output_video
                     ]
                     
                     result3 = subprocess.run(cmd_drawtext, capture_output=True, text=True, timeout=600)
                     
                     if result3.returncode == 0:
-                        if os.path.exists(output_video) and os.path.getsize(output_video) > 1000:
+                        output_stat = _stat_or_none(output_video)
+                        if output_stat and output_stat.st_size > 1000:
                             self.add_log("SUCCESS", f"✅ METHOD 3 (drawtext) SUCCESS!")
                             # Clean up processed SRT
                             try:
@@ -1493,34 +2070,30 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             # Ensure directory exists
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
-            # Write content directly
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(final_content)
-                
-                # Ensure file ends with newline
-                if not final_content.endswith('\n'):
-                    f.write('\n')
-            
-            if os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                
-                # Count blocks for reporting
-                blocks = final_content.strip().split('\n\n')
-                valid_blocks = [b for b in blocks if b.strip()]
-                
-                self.add_log("SUCCESS", f"✅ SRT file created: {file_size} bytes, {len(valid_blocks)} subtitle blocks")
-                
+            # Write atomically (final_content đã strip nên luôn thêm newline cuối)
+            _write_text_atomic(output_path, final_content + '\n')
+
+            output_stat = _stat_or_none(output_path)
+            if output_stat:
+                file_size = output_stat.st_size
+
+                # Count blocks for reporting - chỉ đếm separator, không tách toàn bộ nội dung
+                block_count = sum(1 for _ in SRT_BLOCK_SEPARATOR_RE.finditer(final_content)) + 1
+
+                self.add_log("SUCCESS", f"✅ SRT file created: {file_size} bytes, {block_count} subtitle blocks")
+
                 # Show preview of first 2 blocks
+                preview_blocks = SRT_BLOCK_SEPARATOR_RE.split(final_content, maxsplit=2)[:2]
                 self.add_log("INFO", "📋 SRT preview (first 2 blocks):")
-                for i, block in enumerate(valid_blocks[:2]):
+                for i, block in enumerate(preview_blocks):
                     lines = block.strip().split('\n')
                     for j, line in enumerate(lines):
                         self.add_log("INFO", f"   {i+1}.{j+1}: {line}")
-                    if i < len(valid_blocks) - 1:
+                    if i < block_count - 1:
                         self.add_log("INFO", "   ---")
-                
-                if len(valid_blocks) > 2:
-                    self.add_log("INFO", f"   ... and {len(valid_blocks) - 2} more blocks")
+
+                if block_count > 2:
+                    self.add_log("INFO", f"   ... and {block_count - 2} more blocks")
                 
                 return True
             else:
@@ -1529,8 +2102,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 
         except Exception as e:
             self.add_log("ERROR", f"❌ Error creating SRT: {str(e)}")
-            import traceback
-            self.add_log("ERROR", f"   📋 Traceback: {traceback.format_exc()}")
+            self.add_log_exc("ERROR", "   📋 Traceback: ")
             return False
         
     def process_subtitles_for_video(self, video_path: str, output_dir: str) -> Tuple[bool, str]:
@@ -1540,17 +2112,18 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         try:
             # Lấy thông tin video
             base_name = os.path.basename(video_path)
-            name_without_ext = os.path.splitext(base_name)[0]
-            file_ext = os.path.splitext(base_name)[1]
+            name_without_ext, file_ext = os.path.splitext(base_name)
+            output_video_name = f"{name_without_ext}_with_subtitles{file_ext}"
             
             self.add_log("INFO", f"🎬 [SUBTITLE DEBUG] Starting subtitle processing for: {base_name}")
             
             # Step 1: Validate video file
-            if not os.path.exists(video_path):
+            video_stat = _stat_or_none(video_path)
+            if not video_stat:
                 self.add_log("ERROR", f"❌ [SUBTITLE DEBUG] Video file not found: {video_path}")
                 return False, ""
             
-            file_size_mb = os.path.getsize(video_path) / (1024 * 1024)
+            file_size_mb = video_stat.st_size / (1024 * 1024)
             self.add_log("INFO", f"📊 [SUBTITLE DEBUG] Video file size: {file_size_mb:.2f} MB")
             
             # Step 2: Validate API key
@@ -1560,7 +2133,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 self.add_log("ERROR", "❌ [SUBTITLE DEBUG] API key validation failed")
                 return False, ""
             
-            self.add_log("SUCCESS", f"✅ [SUBTITLE DEBUG] API key validated: {api_key[:10]}...{api_key[-4:]}")
+            self.add_log("SUCCESS", f"✅ [SUBTITLE DEBUG] API key validated: {_mask_api_key(api_key)}")
             
             # Step 3: Get language settings
             source_lang = self.source_lang.currentText()
@@ -1570,21 +2143,12 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             # Step 4: Import validation - 🔥 CRITICAL CHECK
             self.add_log("INFO", "📦 [SUBTITLE DEBUG] Checking import availability...")
-            if not hasattr(self, 'subtitle_import_available'):
-                try:
-                    from gg_api.get_subtitle import process_video_for_subtitles, get_default_words_per_line
-                    self.subtitle_import_available = True
-                    self.add_log("SUCCESS", "✅ [SUBTITLE DEBUG] Subtitle module imported successfully")
-                except ImportError as e:
-                    self.add_log("ERROR", f"❌ [SUBTITLE DEBUG] Failed to import subtitle module: {str(e)}")
-                    return False, ""
-                except Exception as e:
-                    self.add_log("ERROR", f"❌ [SUBTITLE DEBUG] Unexpected import error: {str(e)}")
-                    return False, ""
-            
+            if api_process_video is None:
+                self.add_log("ERROR", "❌ [SUBTITLE DEBUG] Subtitle module not available")
+                return False, ""
+
             # Step 5: Get words per line
             try:
-                from gg_api.get_subtitle import get_default_words_per_line
                 words_per_line = get_default_words_per_line(target_lang)
                 self.add_log("INFO", f"📝 [SUBTITLE DEBUG] Words per line: {words_per_line}")
             except Exception as e:
@@ -1600,23 +2164,19 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             self.add_log("INFO", "⏳ [SUBTITLE DEBUG] This WILL take 30-120 seconds for AI processing...")
             self.add_log("INFO", "🕐 [SUBTITLE DEBUG] Please wait, do NOT close the application...")
             
-            # Force UI update before long operation
-            QApplication.processEvents()
-            
             try:
-                from gg_api.get_subtitle import process_video_for_subtitles as api_process_video
-                
                 # 🔥 ACTUAL API CALL - THIS IS WHERE THE MAGIC HAPPENS
                 start_time = time.time()
-                success, srt_content, message = api_process_video(
-                    video_path=video_path,
-                    api_key=api_key,
-                    source_lang=source_lang,
-                    target_lang=target_lang,
-                    words_per_line=words_per_line,
-                    ffmpeg_path=None,
-                    log_callback=self.add_log  # 🔥 IMPORTANT: Pass log callback
-                )
+                with _api_key_slot(api_key):
+                    success, srt_content, message = api_process_video(
+                        video_path=video_path,
+                        api_key=api_key,
+                        source_lang=source_lang,
+                        target_lang=target_lang,
+                        words_per_line=words_per_line,
+                        ffmpeg_path=None,
+                        log_callback=self.add_log  # 🔥 IMPORTANT: Pass log callback
+                    )
                 end_time = time.time()
                 elapsed_time = end_time - start_time
                 
@@ -1634,8 +2194,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     
             except Exception as api_error:
                 self.add_log("ERROR", f"❌ [SUBTITLE DEBUG] Exception during API call: {str(api_error)}")
-                import traceback
-                self.add_log("ERROR", f"   📋 API call traceback: {traceback.format_exc()}")
+                self.add_log_exc("ERROR", "   📋 API call traceback: ")
                 return False, ""
             
             if not success:
@@ -1649,11 +2208,11 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             # Step 8: Save SRT file
             self.add_log("INFO", "💾 [SUBTITLE DEBUG] Saving SRT file...")
             try:
-                with open(srt_temp_path, 'w', encoding='utf-8') as f:
-                    f.write(srt_content)
+                _write_text_atomic(srt_temp_path, srt_content)
                 
-                if os.path.exists(srt_temp_path):
-                    srt_file_size = os.path.getsize(srt_temp_path)
+                srt_stat = _stat_or_none(srt_temp_path)
+                if srt_stat:
+                    srt_file_size = srt_stat.st_size
                     self.add_log("SUCCESS", f"✅ [SUBTITLE DEBUG] SRT file saved: {srt_file_size} bytes")
                 else:
                     self.add_log("ERROR", "❌ [SUBTITLE DEBUG] SRT file not created")
@@ -1664,7 +2223,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 return False, ""
             
             # Step 9: Create output video path
-            output_video_path = os.path.join(output_dir, f"{name_without_ext}_with_subtitles{file_ext}")
+            output_video_path = os.path.join(output_dir, output_video_name)
             self.add_log("INFO", f"🎬 [SUBTITLE DEBUG] Output video path: {output_video_path}")
             
             # Step 10: Add subtitle to video using FFmpeg
@@ -1676,7 +2235,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             )
             
             if subtitle_success:
-                self.add_log("SUCCESS", f"✅ [SUBTITLE DEBUG] Final video created: {os.path.basename(output_video_path)}")
+                self.add_log("SUCCESS", f"✅ [SUBTITLE DEBUG] Final video created: {output_video_name}")
                 
                 # Cleanup SRT file
                 # try:
@@ -1692,8 +2251,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 
         except Exception as e:
             self.add_log("ERROR", f"❌ [SUBTITLE DEBUG] Unexpected error: {str(e)}")
-            import traceback
-            self.add_log("ERROR", f"   📋 Full traceback: {traceback.format_exc()}")
+            self.add_log_exc("ERROR", "   📋 Full traceback: ")
             return False, ""
 
     
@@ -1701,7 +2259,6 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         """Setup default values with font validation"""
         try:
             # 1. MẶC ĐỊNH OUTPUT FOLDER LÀ "output"
-            current_dir = os.path.dirname(os.path.abspath(__file__))
             default_output = os.path.join(current_dir, "output")
             
             # Tạo thư mục output nếu chưa có
@@ -1709,135 +2266,64 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 os.makedirs(default_output)
                 self.add_log("INFO", f"📁 Created default output folder: {default_output}")
             
-            if hasattr(self, 'output_path'):
-                self.output_path.setText(default_output)
-                self.add_log("INFO", f"📤 Default output folder set: {default_output}")
+            # 2. BẢNG MẶC ĐỊNH: (tên widget, setter, giá trị, mô tả log)
+            defaults = (
+                ("output_path", "setText", default_output, f"📤 Output folder: {default_output}"),
+                ("chk_add_banner", "setChecked", True, "🖼️ Add Banner/Logo: ENABLED"),
+                ("banner_x", "setValue", 230, "📍 Banner X position: 230px"),
+                ("banner_y", "setValue", 1400, "📍 Banner Y position: 1400px"),
+                ("banner_height_ratio", "setValue", 0.18, "📏 Banner height ratio: 0.18 (18% of video height)"),
+                ("banner_start_time", "setValue", 5, "⏰ Banner start time: 5 seconds"),
+                ("banner_end_time", "setValue", 12, "⏰ Banner end time: 12 seconds"),
+                ("subtitle_size", "setValue", 60, "🔤 Subtitle font size: 60px"),
+                ("subtitle_y", "setValue", 1400, "📍 Subtitle Y position: 1400px"),
+                ("subtitle_style", "setCurrentText", "White with Shadow", "🎨 Subtitle style: White with Shadow"),
+                ("enable_chromakey", "setChecked", True, "🎭 Chromakey (remove green background): ENABLED"),
+                ("chroma_color", "setEnabled", True, None),
+                ("chroma_tolerance", "setEnabled", True, None),
+                ("chroma_color", "setCurrentText", "Green (0x00ff00)", "🟢 Chromakey color: Green"),
+                ("chk_add_subtitle", "setChecked", True, "📝 Add Subtitles: ENABLED"),
+                ("chk_add_source", "setChecked", True, "📎 Add Source Text: ENABLED"),
+                ("source_x", "setValue", 920, "📎 Source X position: 920px"),
+                ("source_y", "setValue", 230, "📎 Source Y position: 230px"),
+                ("source_font_size", "setValue", 35, "📎 Source font size: 35px"),
+                ("source_font_color", "setCurrentText", "white", "📎 Source font color: white"),
+                ("source_text", "setText", "Social Media", "📎 Source text: Social Media"),
+                ("source_mode_custom", "setChecked", True, "📎 Source mode: Custom text"),
+            )
             
-            # 2. MẶC ĐỊNH BẬT ADD BANNER/LOGO
-            if hasattr(self, 'chk_add_banner'):
-                self.chk_add_banner.setChecked(True)
-                self.add_log("INFO", "🖼️ Add Banner/Logo enabled by default")
+            applied = []
+            for widget_name, setter, value, description in defaults:
+                widget = getattr(self, widget_name, None)
+                if widget is None:
+                    continue
+                getattr(widget, setter)(value)
+                if description:
+                    applied.append(description)
             
-            # 3. BANNER POSITION VÀ SIZE 
-            if hasattr(self, 'banner_x'):
-                self.banner_x.setValue(230)  # X position
-                self.add_log("INFO", f"📍 Default banner X position: 230px")
-                
-            if hasattr(self, 'banner_y'):
-                self.banner_y.setValue(1400)  
-                self.add_log("INFO", f"📍 Default banner Y position: 1400px")
-                
-            if hasattr(self, 'banner_height_ratio'):
-                self.banner_height_ratio.setValue(0.18)  # Height ratio
-                self.add_log("INFO", f"📏 Default banner height ratio: 0.18 (18% of video height)")
-            
-            # 4. BANNER TIMING - TỪ GIÂY 5 ĐẾN GIÂY 12
-            if hasattr(self, 'banner_start_time'):
-                self.banner_start_time.setValue(5)  # Bắt đầu từ giây thứ 5
-                self.add_log("INFO", f"⏰ Default banner start time: 5 seconds")
-                
-            if hasattr(self, 'banner_end_time'):
-                self.banner_end_time.setValue(12)  # Kết thúc ở giây thứ 12
-                self.add_log("INFO", f"⏰ Default banner end time: 12 seconds")
+            self.add_log("INFO", "⚙️ Default settings:<br>&nbsp;&nbsp;&nbsp;" + "<br>&nbsp;&nbsp;&nbsp;".join(applied))
+            
+            # 3. CHECK SOURCE TEXT SETUP
+            self.check_source_text_setup()
+            
+            # 4. CẬP NHẬT PREVIEW NGAY SAU KHI SET DEFAULTS
+            if hasattr(self, '_update_preview_positions'):
+                self._update_preview_positions()
             
-            # 5. SUBTITLE DEFAULTS
+            # 5. TEST GUI SYNC - Đọc lại các giá trị để verify
+            verified = []
             if hasattr(self, 'subtitle_size'):
-                self.subtitle_size.setValue(60)  # Font size mặc định
-                self.add_log("INFO", f"🔤 Default subtitle font size: 60px")
-                
+                verified.append(f"🔤 Font size: {self.subtitle_size.value()}px")
             if hasattr(self, 'subtitle_y'):
-                self.subtitle_y.setValue(1400)  # Y position mặc định
-                self.add_log("INFO", f"📍 Default subtitle Y position: 1400px")
-                
+                verified.append(f"📍 Y position: {self.subtitle_y.value()}px")
             if hasattr(self, 'subtitle_style'):
-                self.subtitle_style.setCurrentText("White with Shadow")  # Style mặc định
-                self.add_log("INFO", f"🎨 Default subtitle style: White with Shadow")
-            
-            # 6. MẶC ĐỊNH BẬT CHROMAKEY (XÓA NỀN XANH)
-            if hasattr(self, 'enable_chromakey'):
-                self.enable_chromakey.setChecked(True)
-                # Enable chromakey controls
-                if hasattr(self, 'chroma_color'):
-                    self.chroma_color.setEnabled(True)
-                if hasattr(self, 'chroma_tolerance'):
-                    self.chroma_tolerance.setEnabled(True)
-                self.add_log("INFO", "🎭 Chromakey (remove green background) enabled by default")
-            
-            # 7. MẶC ĐỊNH CHROMA COLOR LÀ GREEN
-            if hasattr(self, 'chroma_color'):
-                self.chroma_color.setCurrentText("Green (0x00ff00)")
-                self.add_log("INFO", "🟢 Default chromakey color: Green")
-            
-            # 8. MẶC ĐỊNH BẬT SUBTITLE
-            if hasattr(self, 'chk_add_subtitle'):
-                self.chk_add_subtitle.setChecked(True)
-                self.add_log("INFO", "📝 Add Subtitles enabled by default")
-            
-            if hasattr(self, 'chk_add_source'):
-                self.chk_add_source.setChecked(True)
-                self.add_log("INFO", " Add Source Text enabled by default")
-
-            # 9. SOURCE TEXT DEFAULTS
-            if hasattr(self, 'source_x'):
-                self.source_x.setValue(920)
-                self.add_log("INFO", f"📎 Default source X position: 50px")
-                
-            if hasattr(self, 'source_y'):
-                self.source_y.setValue(230)
-                self.add_log("INFO", f"📎 Default source Y position: 50px")
-                
-            if hasattr(self, 'source_font_size'):
-                self.source_font_size.setValue(35)
-                self.add_log("INFO", f"📎 Default source font size: 14px")
-                
-            if hasattr(self, 'source_font_color'):
-                self.source_font_color.setCurrentText("white")
-                self.add_log("INFO", f"📎 Default source font color: white")
-                
-            if hasattr(self, 'source_text'):
-                self.source_text.setText("Social Media")
-                self.add_log("INFO", f"📎 Default source text: Social Media")
-                
-            if hasattr(self, 'source_mode_custom'):
-                self.source_mode_custom.setChecked(True)
-                self.add_log("INFO", f"📎 Default source mode: Custom text")
+                verified.append(f"🎨 Style: {self.subtitle_style.currentText()}")
             
-            # 10. CHECK SOURCE TEXT SETUP
-            self.check_source_text_setup()
-            
-            # 11. CẬP NHẬT PREVIEW NGAY SAU KHI SET DEFAULTS
-            QApplication.processEvents()  # Đảm bảo UI đã load xong
-            if hasattr(self, '_update_preview_positions'):
-                self._update_preview_positions()
-                self.add_log("INFO", "🔄 Preview positions updated with new defaults")
-            
-            # 12. TEST GUI SYNC - Đọc lại các giá trị để verify
-            self.add_log("SUCCESS", "✅ GUI SYNC TEST - Verifying default values:")
-            if hasattr(self, 'subtitle_size'):
-                actual_font = self.subtitle_size.value()
-                self.add_log("INFO", f"   🔤 Font size verified: {actual_font}px")
-            if hasattr(self, 'subtitle_y'):
-                actual_y = self.subtitle_y.value()
-                self.add_log("INFO", f"   📍 Y position verified: {actual_y}px")
-            if hasattr(self, 'subtitle_style'):
-                actual_style = self.subtitle_style.currentText()
-                self.add_log("INFO", f"   🎨 Style verified: {actual_style}")
-            
-            # 13. LOG TỔNG KẾT CÁC SETTINGS
-            self.add_log("SUCCESS", "✅ All default settings applied successfully:")
-            self.add_log("INFO", "   🖼️ Banner: ENABLED")
-            self.add_log("INFO", "   📍 Position: (230, 1400) pixels")
-            self.add_log("INFO", "   📐 Size: 18% of video height")
-            self.add_log("INFO", "   ⏰ Timing: 5-12 seconds (7 seconds duration)")
-            self.add_log("INFO", "   🎭 Chromakey: ENABLED (Green removal)")
-            self.add_log("INFO", "   📝 Subtitle: ENABLED, 60px font, Y=1400px, White with Shadow")
-            self.add_log("INFO", "   📎 Source: Custom mode, @YourChannel, (50,50), 14px, white")
-            self.add_log("INFO", "   📁 Output: ./output folder")
+            self.add_log("SUCCESS", f"✅ {len(applied)} default settings applied, preview updated. Verified: {', '.join(verified)}")
             
         except Exception as e:
             self.add_log("ERROR", f"❌ Error setting defaults: {str(e)}")
-            import traceback
-            self.add_log("ERROR", f"   📋 Traceback: {traceback.format_exc()}")
+            self.add_log_exc("ERROR", "   📋 Traceback: ")
 
     def set_processing_state(self, is_processing):
         """Cập nhật trạng thái processing với spinner"""
@@ -1868,17 +2354,17 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
     def run_banner_processing(self, main_video, banner_video, output_path, params) -> bool:
         """🔥 FIXED: Hàm worker để chạy add_video_banner với error handling tốt hơn"""
         try:
+            main_name, banner_name, output_name = map(os.path.basename, (main_video, banner_video, output_path))
+            
             self.add_log("INFO", "⚙️ Starting FFmpeg banner overlay process...")
-            self.add_log("INFO", f"   📹 Main: {os.path.basename(main_video)}")
-            self.add_log("INFO", f"   🖼️ Banner: {os.path.basename(banner_video)}")
+            self.add_log("INFO", f"   📹 Main: {main_name}")
+            self.add_log("INFO", f"   🖼️ Banner: {banner_name}")
             self.add_log("INFO", f"   📐 Size: {params['banner_width']}x{params['banner_height']}")
             self.add_log("INFO", f"   📍 Position: ({params['position_x']}, {params['position_y']})")
             
             # Đường dẫn FFmpeg
-            ffmpeg_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ffmpeg", "bin", "ffmpeg.exe")
-            
-            if not os.path.exists(ffmpeg_path):
-                self.add_log("ERROR", f"❌ FFmpeg not found: {ffmpeg_path}")
+            if not FFMPEG_AVAILABLE:
+                self.add_log("ERROR", f"❌ FFmpeg not found: {FFMPEG_PATH}")
                 return False
             
             # 🔥 FIXED: Gọi hàm add_video_banner với tham số đầy đủ
@@ -1895,12 +2381,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 blend=params["blend"],
                 start_time=params["start_time"],
                 end_time=params["end_time"],
-                ffmpeg_executable=ffmpeg_path
+                ffmpeg_executable=FFMPEG_PATH,
+                video_codec_args=self._encode_video_args()
             )
 
             if success:
                 self.add_log("SUCCESS", f"✅ Banner overlay completed successfully!")
-                self.add_log("SUCCESS", f"   💾 Output: {os.path.basename(output_path)}")
+                self.add_log("SUCCESS", f"   💾 Output: {output_name}")
                 return True
             else:
                 self.add_log("ERROR", f"❌ FFmpeg banner overlay failed!")
@@ -1918,8 +2405,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     
         except Exception as e:
             self.add_log("ERROR", f"❌ Exception in banner processing: {str(e)}")
-            import traceback
-            self.add_log("ERROR", f"   📋 Full traceback: {traceback.format_exc()}")
+            self.add_log_exc("ERROR", "   📋 Full traceback: ")
             return False
 
 
@@ -1930,8 +2416,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
         try:
             # 🔥 Existing banner and subtitle code...
-            real_banner_x = self.banner_x.value() if hasattr(self, 'banner_x') and self.banner_x is not None else 230
-            real_banner_y = self.banner_y.value() if hasattr(self, 'banner_y') and self.banner_y is not None else 1400
+            real_banner_x = self._banner_state.x
+            real_banner_y = self._banner_state.y
             real_subtitle_y = self.subtitle_y.value() if hasattr(self, 'subtitle_y') and self.subtitle_y is not None else 1200
             
             # 🔥 UPDATED: Get source text values with enhanced info
@@ -1945,7 +2431,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             source_color = self.source_font_color.currentText() if hasattr(self, 'source_font_color') and self.source_font_color is not None else "white"
             
             # Calculate banner dimensions
-            banner_height_ratio = self.banner_height_ratio.value() if hasattr(self, 'banner_height_ratio') and self.banner_height_ratio is not None else 0.18
+            banner_height_ratio = self._banner_state.ratio
             real_banner_height = int(1920 * banner_height_ratio)
             real_banner_width = int(real_banner_height * 16/9)
             
@@ -1963,52 +2449,17 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             self.video_preview.update_from_real_coordinates('subtitle', subtitle_safe_left, real_subtitle_y, subtitle_safe_width, subtitle_height)
             self.video_preview.update_from_real_coordinates('source', real_source_x, real_source_y)
             
-            # 🔥 ENHANCED LOGGING with mapping info
-            self.add_log("DEBUG", f"🔄 Preview updated with GUI values (with universal mapping info):")
-            self.add_log("DEBUG", f"   📍 Banner: ({real_banner_x}, {real_banner_y}) {real_banner_width}x{real_banner_height}")
-            self.add_log("DEBUG", f"   📝 Subtitle: Y={real_subtitle_y}, Font={gui_font_size}px, Style={gui_style}")
-            self.add_log("DEBUG", f"   📎 Source: ({real_source_x}, {real_source_y}), Font={source_font_size}px, Color={source_color}")
-            self.add_log("DEBUG", f"   💡 Note: Source text will auto-scale for different video sizes")
+            # 🔥 ENHANCED LOGGING with mapping info - chỉ format khi DEBUG được hiển thị
+            if self.log_enabled("DEBUG"):
+                self.add_log("DEBUG", f"🔄 Preview updated with GUI values (with universal mapping info):")
+                self.add_log("DEBUG", f"   📍 Banner: ({real_banner_x}, {real_banner_y}) {real_banner_width}x{real_banner_height}")
+                self.add_log("DEBUG", f"   📝 Subtitle: Y={real_subtitle_y}, Font={gui_font_size}px, Style={gui_style}")
+                self.add_log("DEBUG", f"   📎 Source: ({real_source_x}, {real_source_y}), Font={source_font_size}px, Color={source_color}")
+                self.add_log("DEBUG", f"   💡 Note: Source text will auto-scale for different video sizes")
             
         except Exception as e:
             self.add_log("ERROR", f"❌ Error updating preview positions: {str(e)}")
 
-    # SỬA 3: Hàm init_ui() - THAY THẾ TOÀN BỘ
-    def init_ui(self):
-        """Create main layout and panels"""
-        # Main widget and layout
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        
-        main_layout = QHBoxLayout(central_widget)
-        main_layout.setSpacing(20)
-        main_layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Create splitter for resizable panels
-        splitter = QSplitter(Qt.Horizontal)
-        main_layout.addWidget(splitter)
-        
-        # Left panel (file management and settings)
-        left_panel = self.create_left_panel()
-        splitter.addWidget(left_panel)
-        
-        # Right panel (preview and processing)
-        right_panel = self.create_right_panel()
-        splitter.addWidget(right_panel)
-        
-        # Set panel sizes
-        splitter.setSizes([650, 950])
-        
-        # Status bar and menu
-        self.statusBar().showMessage("Ready - Optimized for 9:16 Videos")
-        self.statusBar().setStyleSheet("QStatusBar { background-color: #2d3748; color: #e2e8f0; }")
-        self.create_menu_bar()
-        
-        # Load API setup after UI is created
-        self.setup_api_components()
-
-
-
     # THÊM MỚI 2: Sử dụng key đã chọn từ dropdown
     def use_selected_api_key(self):
         """Use the selected API key from dropdown with clear feedback"""
@@ -2043,9 +2494,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             self.api_status_label.setStyleSheet("color: #0ea5e9; font-weight: bold;")
             
             # Clear and informative logging
-            self.add_log("SUCCESS", f"✅ API key selected: {selected_text}")
-            self.add_log("INFO", "💡 Key has been loaded into manual field")
-            self.add_log("INFO", "🔍 Click 'Test' button to validate the key")
+            self.add_log("SUCCESS", f"✅ API key selected: {selected_text}<br>"
+                         "&nbsp;&nbsp;&nbsp;💡 Key has been loaded into manual field - click 'Test' to validate it")
             
             # Flash effect for user feedback (optional)
             self.api_key_input.setStyleSheet("""
@@ -2055,11 +2505,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 }
             """)
             
-            # Reset style after a moment
-            QApplication.processEvents()
-            import time
-            time.sleep(0.1)
-            self.api_key_input.setStyleSheet("")  # Reset to default
+            # Reset style after a moment - qua event loop, không block GUI thread
+            QTimer.singleShot(120, lambda: self.api_key_input.setStyleSheet(""))  # Reset to default
             
         except Exception as e:
             self.add_log("ERROR", f"❌ Error selecting API key: {str(e)}")
@@ -2075,22 +2522,61 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
     # THÊM MỚI 1: Hàm phụ trợ để cập nhật trạng thái API một cách nhất quán
     def _update_api_status(self, api_number: int, status: str, message: str):
         """Update API status label"""
-        status_colors = {
-            "SUCCESS": "#16a34a",
-            "ERROR": "#dc2626", 
-            "WARNING": "#d97706",
-            "INFO": "#0ea5e9",
-            "TESTING": "#d97706"
-        }
-        color = status_colors.get(status, "#6b7280")
-        
-        if api_number == 1 and hasattr(self, 'api_status_label'):
-            self.api_status_label.setText(f"Primary API: {message}")
-            self.api_status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
-        elif api_number == 2 and hasattr(self, 'api_status_label_2'):
-            self.api_status_label_2.setText(f"Secondary API: {message}")
-            self.api_status_label_2.setStyleSheet(f"color: {color}; font-weight: bold;")
+        slot = self._api_slots.get(api_number)
+        if slot is None:
+            return
+        _, _, label, prefix, _ = slot
+        label.setText(f"{prefix}: {message}")
+        label.setStyleSheet(self._STATUS_STYLES.get(status, self._DEFAULT_STATUS_STYLE))
+
+
+    def _parse_api_keys(self):
+        """
+        Đọc gg_api/api_key.json thành list [(display_text, api_key), ...] dùng chung cho mọi dropdown.
+        Hỗ trợ cả list JSON [{name: key}, ...] và JSONL (mỗi dòng một {name: key}).
+        Chỉ parse lại khi mtime của file thay đổi; raise FileNotFoundError nếu không có file.
+        """
+        json_path = API_KEY_JSON_PATH
+        mtime = os.stat(json_path).st_mtime_ns
+        if self._api_keys_cache is not None and mtime == self._api_keys_mtime:
+            return self._api_keys_cache
+
+        entries = []
+        with open(json_path, 'rb') as f:
+            if _is_jsonl_file(f):
+                # JSONL: parse từng dòng, dừng sớm được mà không cần đọc hết file
+                api_data = (_json_loads(line) for line in f if line.strip())
+            else:
+                api_data = ijson.items(f, 'item') if ijson else _json_loads(f.read())
+            for item in api_data:
+                if isinstance(item, dict):
+                    for name, api_key in item.items():
+                        if api_key and len(api_key) > 14:
+                            # Một f-string duy nhất cho display text (cùng format với _mask_api_key)
+                            entries.append((f"🔑 {name} ({api_key[:10]}...{api_key[-4:]})", api_key))
+                if len(entries) >= MAX_VISIBLE_API_KEYS:
+                    del entries[MAX_VISIBLE_API_KEYS:]
+                    break
+
+        self._api_keys_cache = entries
+        self._api_keys_mtime = mtime
+        return entries
 
+    def _populate_combo(self, combo, entries, header=None):
+        """
+        Đổ [(text, data), ...] vào combo qua một QStandardItemModel dựng sẵn:
+        combo chỉ nhận 1 lần setModel thay vì N lần addItem (mỗi lần là 1 lượt signal + relayout).
+        """
+        model = QStandardItemModel(combo)
+        if header:
+            model.appendRow(QStandardItem(header))
+        for text, data in entries:
+            item = QStandardItem(text)
+            item.setData(data, Qt.UserRole)
+            model.appendRow(item)
+        with QSignalBlocker(combo):
+            combo.setModel(model)
+            combo.setCurrentIndex(0)
 
     def load_api_keys_to_both_dropdowns(self):
         """Load API keys vào cả 2 dropdown"""
@@ -2102,36 +2588,19 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         self.api_key_pool_2.clear()
         
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            json_path = os.path.join(current_dir, "gg_api", "api_key.json")
-            
-            if not os.path.exists(json_path):
+            try:
+                entries = self._parse_api_keys()
+            except FileNotFoundError:
                 self.api_key_pool_1.addItem("❌ api_key.json not found")
                 self.api_key_pool_2.addItem("❌ api_key.json not found")
                 return
 
-            with open(json_path, 'r', encoding='utf-8') as f:
-                api_data = json.load(f)
-
-            key_count = 0
-            for item in api_data:
-                if isinstance(item, dict):
-                    for name, api_key in item.items():
-                        if api_key and len(api_key) > 14:
-                            masked_key = f"{api_key[:10]}...{api_key[-4:]}"
-                            display_text = f"🔑 {name} ({masked_key})"
-                            
-                            # Add to both dropdowns
-                            self.api_key_pool_1.addItem(display_text, api_key)
-                            self.api_key_pool_2.addItem(display_text, api_key)
-                            key_count += 1
+            key_count = len(entries)
             
             if key_count > 0:
-                # Add headers
-                self.api_key_pool_1.insertItem(0, "📊 Select Primary API Key...")
-                self.api_key_pool_2.insertItem(0, "📊 Select Secondary API Key...")
-                self.api_key_pool_1.setCurrentIndex(0)
-                self.api_key_pool_2.setCurrentIndex(0)
+                # Add to both dropdowns (header + keys)
+                self._populate_combo(self.api_key_pool_1, entries, "📊 Select Primary API Key...")
+                self._populate_combo(self.api_key_pool_2, entries, "📊 Select Secondary API Key...")
                 
                 self.add_log("SUCCESS", f"✅ Loaded {key_count} API keys to both pools")
             else:
@@ -2146,18 +2615,22 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
     # SỬA ĐỔI 1: Hàm thiết lập các thành phần API khi khởi động
     def setup_api_components(self):
         """Initialize dual API system"""
-        self.add_log("INFO", "🚀 Initializing DUAL API system...")
-        QApplication.processEvents()
+        # Widget theo api_number: (input, pool, status label, prefix, nút Test)
+        # Lấy sau khi cả 2 panel đã tạo xong (right panel tạo lại api_status_label)
+        self._api_slots = {
+            1: (self.api_key_input, self.api_key_pool_1, self.api_status_label, "Primary API", self.btn_test_api1),
+            2: (self.api_key_input_2, self.api_key_pool_2, self.api_status_label_2, "Secondary API", self.btn_test_api2)
+        }
 
-        # Load keys vào cả 2 dropdowns
-        self.load_api_keys_to_both_dropdowns()
+        # Load keys vào cả 2 dropdowns - hoãn tới khi event loop rảnh để cửa sổ hiện trước
+        QTimer.singleShot(0, self.load_api_keys_to_both_dropdowns)
         
         # Set initial status
         self._update_api_status(1, "INFO", "💡 Ready - Enter key or select from pool")
         self._update_api_status(2, "INFO", "💡 Ready - Enter key or select from pool")
 
-        self.add_log("SUCCESS", "✅ DUAL API system initialized")
-        self.add_log("INFO", "📋 Tip: Use 2 different API keys for 2x faster processing!")
+        self.add_log("SUCCESS", "✅ DUAL API system initialized<br>"
+                     "&nbsp;&nbsp;&nbsp;📋 Tip: Use 2 different API keys for 2x faster processing!")
 
 
     # SỬA ĐỔI 2: Hàm tải API key vào dropdown
@@ -2170,33 +2643,21 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         self.add_log("INFO", "🔄 Loading API keys from pool...")
         
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            json_path = os.path.join(current_dir, "gg_api", "api_key.json")
-            
-            if not os.path.exists(json_path):
+            try:
+                entries = self._parse_api_keys()
+            except FileNotFoundError as e:
                 self.api_key_pool.addItem("❌ Không tìm thấy file api_key.json")
                 if hasattr(self, 'backup_api_label'):
                     self.backup_api_label.setText("❌ File api_key.json không tồn tại")
                     self.backup_api_label.setStyleSheet("color: #dc2626;")
-                self.add_log("ERROR", f"File not found: {json_path}")
+                self.add_log("ERROR", f"File not found: {e.filename}")
                 return
 
-            with open(json_path, 'r', encoding='utf-8') as f:
-                api_data = json.load(f)
-
-            key_count = 0
-            for item in api_data:
-                if isinstance(item, dict):
-                    for name, api_key in item.items():
-                        if api_key and len(api_key) > 14:
-                            masked_key = f"{api_key[:10]}...{api_key[-4:]}"
-                            display_text = f"🔑 {name} ({masked_key})"
-                            self.api_key_pool.addItem(display_text, api_key) # Lưu key đầy đủ vào data
-                            key_count += 1
+            key_count = len(entries)
             
             if key_count > 0:
-                self.api_key_pool.insertItem(0, "📊 Chọn một key từ pool...")
-                self.api_key_pool.setCurrentIndex(0)
+                # Key đầy đủ được lưu vào data của item
+                self._populate_combo(self.api_key_pool, entries, "📊 Chọn một key từ pool...")
                 if hasattr(self, 'backup_api_label'):
                     self.backup_api_label.setText(f"✅ API Pool: {key_count} keys khả dụng")
                     self.backup_api_label.setStyleSheet("color: #16a34a; font-weight: bold;")
@@ -2208,7 +2669,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                     self.backup_api_label.setStyleSheet("color: #d97706;")
                 self.add_log("WARNING", "API key file is empty or contains no valid keys.")
 
-        except (json.JSONDecodeError, FileNotFoundError) as e:
+        except API_KEY_PARSE_ERRORS as e:
             error_msg = f"Error loading API keys: {str(e)}"
             self.api_key_pool.addItem("❌ Lỗi khi tải keys")
             if hasattr(self, 'backup_api_label'):
@@ -2228,44 +2689,10 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         else:
             self._update_api_status("WARNING", "⚠️ Vui lòng chọn một key hợp lệ từ danh sách.")
 
-    # SỬA ĐỔI 4: Hàm kiểm tra API key được viết lại hoàn toàn
-    # SỬA LẠI LẦN CUỐI: Hàm test_api_key đơn giản, không dùng thread
+    # SỬA ĐỔI 4: Hàm kiểm tra API key - chạy nền qua test_single_api_key
     def test_api_key(self):
-        """
-        Kiểm tra API key một cách trực tiếp (có thể làm đơ GUI tối đa 10 giây).
-        """
-        api_key_to_test = self.api_key_input.text().strip()
-        
-        sender_btn = self.findChild(QPushButton, "testButton")
-
-        if not api_key_to_test:
-            self._update_api_status("WARNING", "⚠️ Chưa nhập API key.")
-            return
-
-        # Vô hiệu hóa nút và cập nhật UI
-        if sender_btn:
-            sender_btn.setEnabled(False)
-            sender_btn.setText("🔄 Testing...")
-        self._update_api_status("TESTING", "🔄 Đang kiểm tra key...")
-        QApplication.processEvents() # Ép giao diện cập nhật ngay
-
-        try:
-            # Gọi trực tiếp hàm test đã có timeout
-            results = test_key_function(api_key_to_test)
-            
-            if results and results.get("success"):
-                self._update_api_status("SUCCESS", results.get("message"))
-                self.add_log("SUCCESS", f"Model: {results.get('text_model', 'N/A')}")
-            else:
-                self._update_api_status("ERROR", results.get("message", "Lỗi không xác định"))
-
-        except Exception as e:
-            self._update_api_status("ERROR", f"❌ Lỗi khi gọi hàm test: {str(e)}")
-        finally:
-            # Luôn kích hoạt lại nút sau khi test xong
-            if sender_btn:
-                sender_btn.setEnabled(True)
-                sender_btn.setText("🔍 Test")
+        """Kiểm tra Primary API key (không block GUI - xem test_single_api_key)"""
+        self.test_single_api_key(1)
     # ==============================================================================
     # == KẾT THÚC KHỐI CODE QUẢN LÝ API KEY ========================================
     # ==============================================================================
@@ -2275,14 +2702,12 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
     def load_voice_data(self):
         """Load voice information from JSON file"""
         try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            json_path = os.path.join(current_dir, "gg_api", "voice_info.json")
-            
-            with open(json_path, 'r', encoding='utf-8') as f:
-                voice_data = json.load(f)
+            mtime = os.stat(VOICE_JSON_PATH).st_mtime_ns
+            voice_data, self._voice_index = _load_voice_data_cached(mtime)
             
-            # Chỉ log nếu log_text đã được tạo
-            if hasattr(self, 'log_text'):
+            # Chỉ log khi file thực sự được đọc (lần đầu / file đổi) và log_text đã được tạo
+            if mtime != self._voice_data_mtime and hasattr(self, 'log_text'):
+                self._voice_data_mtime = mtime
                 self.add_log("SUCCESS", f"✅ Loaded {len(voice_data)} voices from voice_info.json")
             
             return voice_data
@@ -2295,6 +2720,19 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 self.add_log("ERROR", "❌ Error parsing voice_info.json")
             return []
 
+    def _on_voices_loaded(self, result, error):
+        """Nhận voice data từ VoiceLoadWorker và đổ vào voice_combo (chạy trên GUI thread)"""
+        if result and result[1]:
+            self._voice_data_mtime, voice_data, self._voice_index = result
+            # Display text được dựng khi view cần; data (UserRole) là actual voice name
+            self.voice_combo.setModel(VoiceListModel(voice_data, self.voice_combo))
+            self.add_log("SUCCESS", f"✅ Loaded {len(voice_data)} voices from voice_info.json")
+        else:
+            self.voice_combo.clear()
+            self.voice_combo.addItem("❌ No voices loaded")
+            if error:
+                self.add_log("ERROR", error)
+
     def preview_voice(self):
         """Preview selected voice with sample text"""
         if not hasattr(self, 'voice_combo') or self.voice_combo.count() == 0:
@@ -2340,24 +2778,26 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         if not selected_voice:
             return None
         
-        # Load voice data and find selected voice info
-        voice_data = self.load_voice_data()
-        for voice in voice_data:
-            if voice.get("Voice Name") == selected_voice:
-                return {
-                    "name": voice.get("Voice Name"),
-                    "characteristic": voice.get("Characteristic"),
-                    "gender": voice.get("Inferred Gender"),
-                    "speed": self.voice_speed.value()
-                }
+        # Load voice data (cached theo mtime) and look up selected voice info
+        self.load_voice_data()
+        voice = self._voice_index.get(selected_voice)
+        if voice is None:
+            return None
         
-        return None
+        return {
+            "name": voice.get("Voice Name"),
+            "characteristic": voice.get("Characteristic"),
+            "gender": voice.get("Inferred Gender"),
+            "speed": self.voice_speed.value()
+        }
 
     def init_ui(self):
         """Create main layout and panels"""
         # Main widget and layout
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
+        # Gom toàn bộ relayout/repaint khi dựng panel thành 1 lần ở cuối
+        central_widget.setUpdatesEnabled(False)
         
         main_layout = QHBoxLayout(central_widget)
         main_layout.setSpacing(20)
@@ -2385,6 +2825,9 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         # Load API setup after UI is created
         self.setup_api_components() # Dòng này sẽ gọi bộ hàm mới mà bạn vừa dán vào
+        
+        central_widget.setUpdatesEnabled(True)
+        central_widget.update()
     
     def process_subtitles_for_video_with_api(self, video_path: str, output_dir: str, 
                                        api_key: str, settings: dict) -> Tuple[bool, str]:
@@ -2399,18 +2842,21 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             source_lang = settings.get('source_lang', '🔍 Auto Detect')
             target_lang = settings.get('target_lang', '🇺🇸 English (US)')
             
-            # Import and call API function with specific key
-            from gg_api.get_subtitle import process_video_for_subtitles
-            
-            success, srt_content, message = process_video_for_subtitles(
-                video_path=video_path,
-                api_key=api_key,  # 🔥 Use specific API key
-                source_lang=source_lang,
-                target_lang=target_lang,
-                words_per_line=8,
-                ffmpeg_path=None,
-                log_callback=self.add_log
-            )
+            # Call API function with specific key
+            if api_process_video is None:
+                self.add_log("ERROR", "❌ Subtitle module not available")
+                return False, ""
+            
+            with _api_key_slot(api_key):
+                success, srt_content, message = api_process_video(
+                    video_path=video_path,
+                    api_key=api_key,  # 🔥 Use specific API key
+                    source_lang=source_lang,
+                    target_lang=target_lang,
+                    words_per_line=8,
+                    ffmpeg_path=None,
+                    log_callback=self.add_log
+                )
             
             if not success:
                 return False, ""
@@ -2434,60 +2880,52 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 return False, ""
                 
         except Exception as e:
-            self.log_message.emit("ERROR", f"❌ API-specific subtitle error: {str(e)}")
+            self.add_log("ERROR", f"❌ API-specific subtitle error: {str(e)}")
             return False, ""
 
     def test_single_api_key(self, api_number: int):
         """Test individual API key"""
-        if api_number == 1:
-            api_key = self.api_key_input.text().strip()
-            btn = self.findChild(QPushButton)  # Find test button
-        else:
-            api_key = self.api_key_input_2.text().strip()
-            btn = None
+        api_input, _, _, _, btn = self._api_slots[api_number]
+        api_key = api_input.text().strip()
             
         if not api_key:
             self._update_api_status(api_number, "WARNING", "⚠️ API key field is empty")
             return
 
+        if not API_TESTING_AVAILABLE:
+            self._update_api_status(api_number, "ERROR", "❌ Test module not available")
+            return
+
         # Update button and status
-        if btn:
-            btn.setEnabled(False)
-            btn.setText("🔄 Testing...")
+        btn.setEnabled(False)
+        btn.setText("🔄 Testing...")
         
         self._update_api_status(api_number, "TESTING", "🔄 Testing API key...")
-        QApplication.processEvents()
 
-        try:
-            if API_TESTING_AVAILABLE:
-                from gg_api.test_api import test_api_key as test_function
-                results = test_function(api_key)
-                
-                if results and results.get("success"):
-                    self._update_api_status(api_number, "SUCCESS", "✅ Valid API key")
-                    self.add_log("SUCCESS", f"API {api_number} validated: {results.get('text_model', 'N/A')}")
-                else:
-                    self._update_api_status(api_number, "ERROR", "❌ Invalid API key")
-            else:
-                self._update_api_status(api_number, "ERROR", "❌ Test module not available")
+        # Test chạy trong QThreadPool, kết quả về _on_api_test_done
+        worker = ApiTestWorker(api_number, api_key)
+        worker.signals.finished.connect(self._on_api_test_done)
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_api_test_done(self, api_number: int, results):
+        """Nhận kết quả từ ApiTestWorker (chạy trên GUI thread)"""
+        if results and results.get("success"):
+            self._update_api_status(api_number, "SUCCESS", "✅ Valid API key")
+            self.add_log("SUCCESS", f"API {api_number} validated: {results.get('text_model', 'N/A')}")
+        elif results and results.get("message", "").startswith("❌ Test failed"):
+            self._update_api_status(api_number, "ERROR", results["message"])
+        else:
+            self._update_api_status(api_number, "ERROR", "❌ Invalid API key")
 
-        except Exception as e:
-            self._update_api_status(api_number, "ERROR", f"❌ Test failed: {str(e)}")
-        finally:
-            if btn:
-                btn.setEnabled(True)
-                btn.setText("🔍 Test")
+        btn = self._api_slots[api_number][4]
+        btn.setEnabled(True)
+        btn.setText("🔍 Test")
 
     def use_selected_api_key_from_pool(self, api_number: int):
         """Use selected API key from pool"""
-        if api_number == 1:
-            selected_key = self.api_key_pool_1.currentData()
-            selected_text = self.api_key_pool_1.currentText()
-            target_input = self.api_key_input
-        else:
-            selected_key = self.api_key_pool_2.currentData()
-            selected_text = self.api_key_pool_2.currentText()
-            target_input = self.api_key_input_2
+        target_input, pool, _, _, _ = self._api_slots[api_number]
+        selected_key = pool.currentData()
+        selected_text = pool.currentText()
         
         if selected_key and "📊" not in selected_text:
             target_input.setText(selected_key)
@@ -2499,35 +2937,30 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
     def auto_fill_dual_apis(self):
         """Automatically fill both APIs with different keys from pool"""
         try:
-            # Get all available keys
-            available_keys = []
-            for i in range(1, self.api_key_pool_1.count()):  # Skip header
-                key_data = self.api_key_pool_1.itemData(i)
-                if key_data:
-                    available_keys.append((i, key_data))
+            # Dùng lại list đã parse khi load pool (cùng thứ tự với dropdown, header ở index 0)
+            available_keys = self._api_keys_cache or []
             
             if len(available_keys) < 2:
                 self.add_log("WARNING", "⚠️ Need at least 2 different API keys for parallel processing")
                 return
             
             # Select first 2 different keys
-            key1_idx, key1 = available_keys[0]
-            key2_idx, key2 = available_keys[1]
+            (_, key1), (_, key2) = available_keys[:2]
             
             # Fill both inputs
             self.api_key_input.setText(key1)
             self.api_key_input_2.setText(key2)
             
-            # Update dropdowns
-            self.api_key_pool_1.setCurrentIndex(key1_idx)
-            self.api_key_pool_2.setCurrentIndex(key2_idx)
+            # Update dropdowns - không phát currentIndexChanged cho thay đổi hàng loạt
+            with QSignalBlocker(self.api_key_pool_1), QSignalBlocker(self.api_key_pool_2):
+                self.api_key_pool_1.setCurrentIndex(1)
+                self.api_key_pool_2.setCurrentIndex(2)
             
             # Update status
             self._update_api_status(1, "INFO", "🔑 Auto-filled - Click Test")
             self._update_api_status(2, "INFO", "🔑 Auto-filled - Click Test")
             
-            self.add_log("SUCCESS", "✅ Auto-filled both API keys from pool")
-            self.add_log("INFO", "🔍 Please test both keys before processing")
+            self.add_log("SUCCESS", "✅ Auto-filled both API keys from pool - please test both keys before processing")
             
         except Exception as e:
             self.add_log("ERROR", f"❌ Auto-fill failed: {str(e)}")
@@ -2597,8 +3030,9 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         file_layout.addWidget(btn_clear_all)
         
         # File list widget
-        self.file_list = QListWidget()
+        self.file_list = QListView()
         self.file_list.setObjectName("modernList")
+        self.file_list.setModel(self._file_model)
         self.file_list.setMaximumHeight(150)  # Limit height to save space
         file_layout.addWidget(QLabel("Selected Files (9:16 Videos):"))
         file_layout.addWidget(self.file_list)
@@ -2632,6 +3066,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         btn_test_api1 = QPushButton("🔍 Test")
         btn_test_api1.setObjectName("testButton")
         btn_test_api1.clicked.connect(lambda: self.test_single_api_key(1))
+        self.btn_test_api1 = btn_test_api1
         api_grid.addWidget(btn_test_api1, 1, 2)
         
         # Secondary API Key  
@@ -2645,6 +3080,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         btn_test_api2 = QPushButton("🔍 Test")
         btn_test_api2.setObjectName("testButton")
         btn_test_api2.clicked.connect(lambda: self.test_single_api_key(2))
+        self.btn_test_api2 = btn_test_api2
         api_grid.addWidget(btn_test_api2, 2, 2)
         
         # OR separator
@@ -2658,6 +3094,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         api_grid.addWidget(QLabel("Primary from Pool:"), 4, 0)
         self.api_key_pool_1 = QComboBox()
         self.api_key_pool_1.setObjectName("modernCombo")
+        self.api_key_pool_1.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.api_key_pool_1.setMinimumContentsLength(24)
         api_grid.addWidget(self.api_key_pool_1, 4, 1)
         
         btn_use_pool1 = QPushButton("✅ Use")
@@ -2667,6 +3105,8 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         api_grid.addWidget(QLabel("Secondary from Pool:"), 5, 0)
         self.api_key_pool_2 = QComboBox()
         self.api_key_pool_2.setObjectName("modernCombo")
+        self.api_key_pool_2.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+        self.api_key_pool_2.setMinimumContentsLength(24)
         api_grid.addWidget(self.api_key_pool_2, 5, 1)
         
         btn_use_pool2 = QPushButton("✅ Use")
@@ -2705,155 +3145,17 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         lang_grid.addWidget(QLabel("Source Language:"), 0, 0)
         self.source_lang = QComboBox()
         self.source_lang.setObjectName("modernCombo")
-        self.source_lang.addItems([
-            "🔍 Auto Detect",
-    
-    # === ALPHABETICAL ORDER ===
-    "🇦🇱 Albanian",
-    "🇸🇦 Arabic",
-    "🇦🇪 Arabic (UAE)",
-    "🇪🇬 Arabic (Egypt)",
-    "🇦🇷 Argentina (Spanish)",
-    "🇧🇩 Bengali",
-    "🇧🇦 Bosnian",
-    "🇧🇷 Brazil (Portuguese)",
-    "🇧🇬 Bulgarian",
-    "🇪🇸 Catalan",
-    "🇨🇱 Chile (Spanish)",
-    "🇨🇳 Chinese (Simplified)",
-    "🇹🇼 Chinese (Traditional)",
-    "🇨🇴 Colombia (Spanish)",
-    "🇭🇷 Croatian",
-    "🇨🇿 Czech Republic",
-    "🇩🇰 Danish",
-    "🇳🇱 Dutch",
-    "🇺🇸 English (US)",
-    "🇬🇧 English (UK)",
-    "🇨🇦 English (Canada)",
-    "🇦🇺 English (Australia)",
-    "🇳🇿 English (New Zealand)",
-    "🇮🇪 English (Ireland)",
-    "🇿🇦 English (South Africa)",
-    "🇪🇪 Estonian",
-    "🇵🇭 Filipino",
-    "🇫🇮 Finnish",
-    "🇫🇷 French",
-    "🇩🇪 German",
-    "🇬🇷 Greece",
-    "🇮🇳 Gujarati",
-    "🇮🇱 Hebrew",
-    "🇮🇳 Hindi",
-    "🇭🇺 Hungary",
-    "🇮🇩 Indonesian",
-    "🇮🇹 Italian",
-    "🇯🇵 Japanese",
-    "🇮🇳 Kannada",
-    "🇰🇷 Korean",
-    "🇱🇻 Latvia",
-    "🇱🇹 Lithuania",
-    "🇲🇰 Macedonian",
-    "🇲🇾 Malay",
-    "🇮🇳 Malayalam",
-    "🇮🇳 Marathi",
-    "🇲🇽 Mexico (Spanish)",
-    "🇳🇴 Norwegian",
-    "🇮🇷 Persian",
-    "🇵🇪 Peru (Spanish)",
-    "🇵🇱 Polish",
-    "🇵🇹 Portuguese",
-    "🇷🇴 Romania",
-    "🇷🇺 Russian",
-    "🇷🇸 Serbia",
-    "🇸🇰 Slovakia",
-    "🇸🇮 Slovenia",
-    "🇪🇸 Spanish",
-    "🇸🇪 Swedish",
-    "🇮🇳 Tamil",
-    "🇮🇳 Telugu",
-    "🇹🇭 Thai",
-    "🇹🇷 Turkish",
-    "🇺🇦 Ukrainian",
-    "🇵🇰 Urdu",
-    "🇻🇪 Venezuela (Spanish)",
-    "🇻🇳 Vietnamese"
-
-        ])
+        self.source_lang.setModel(self._lang_model)
         lang_grid.addWidget(self.source_lang, 0, 1)
         
         # Target Language
         lang_grid.addWidget(QLabel("Target Language:"), 1, 0)
         self.target_lang = QComboBox()
         self.target_lang.setObjectName("modernCombo")
-        self.target_lang.addItems([
-            # === ALPHABETICAL ORDER ===
-    "🇦🇱 Albanian",
-    "🇸🇦 Arabic",
-    "🇦🇪 Arabic (UAE)",
-    "🇪🇬 Arabic (Egypt)",
-    "🇦🇷 Argentina (Spanish)",
-    "🇧🇩 Bengali",
-    "🇧🇦 Bosnian",
-    "🇧🇷 Brazil (Portuguese)",
-    "🇧🇬 Bulgarian",
-    "🇪🇸 Catalan",
-    "🇨🇱 Chile (Spanish)",
-    "🇨🇳 Chinese (Simplified)",
-    "🇹🇼 Chinese (Traditional)",
-    "🇨🇴 Colombia (Spanish)",
-    "🇭🇷 Croatian",
-    "🇨🇿 Czech Republic",
-    "🇩🇰 Danish",
-    "🇳🇱 Dutch",
-    "🇺🇸 English (US)",
-    "🇬🇧 English (UK)",
-    "🇨🇦 English (Canada)",
-    "🇦🇺 English (Australia)",
-    "🇳🇿 English (New Zealand)",
-    "🇮🇪 English (Ireland)",
-    "🇿🇦 English (South Africa)",
-    "🇪🇪 Estonian",
-    "🇵🇭 Filipino",
-    "🇫🇮 Finnish",
-    "🇫🇷 French",
-    "🇩🇪 German",
-    "🇬🇷 Greece",
-    "🇮🇳 Gujarati",
-    "🇮🇱 Hebrew",
-    "🇮🇳 Hindi",
-    "🇭🇺 Hungary",
-    "🇮🇩 Indonesian",
-    "🇮🇹 Italian",
-    "🇯🇵 Japanese",
-    "🇮🇳 Kannada",
-    "🇰🇷 Korean",
-    "🇱🇻 Latvia",
-    "🇱🇹 Lithuania",
-    "🇲🇰 Macedonian",
-    "🇲🇾 Malay",
-    "🇮🇳 Malayalam",
-    "🇮🇳 Marathi",
-    "🇲🇽 Mexico (Spanish)",
-    "🇳🇴 Norwegian",
-    "🇮🇷 Persian",
-    "🇵🇪 Peru (Spanish)",
-    "🇵🇱 Polish",
-    "🇵🇹 Portuguese",
-    "🇷🇴 Romania",
-    "🇷🇺 Russian",
-    "🇷🇸 Serbia",
-    "🇸🇰 Slovakia",
-    "🇸🇮 Slovenia",
-    "🇪🇸 Spanish",
-    "🇸🇪 Swedish",
-    "🇮🇳 Tamil",
-    "🇮🇳 Telugu",
-    "🇹🇭 Thai",
-    "🇹🇷 Turkish",
-    "🇺🇦 Ukrainian",
-    "🇵🇰 Urdu",
-    "🇻🇪 Venezuela (Spanish)",
-    "🇻🇳 Vietnamese"
-        ])
+        # Cùng model với source_lang, bỏ dòng Auto Detect qua proxy
+        target_lang_model = SkipFirstRowProxyModel(self.target_lang)
+        target_lang_model.setSourceModel(self._lang_model)
+        self.target_lang.setModel(target_lang_model)
         lang_grid.addWidget(self.target_lang, 1, 1)
         
         ai_layout.addWidget(lang_frame)
@@ -2869,28 +3171,11 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         self.voice_combo.setObjectName("modernCombo")
 
         # Load and populate voice dropdown with data from JSON
-        voice_data = self.load_voice_data()
-        if voice_data:
-            for voice in voice_data:
-                voice_name = voice.get("Voice Name", "Unknown")
-                characteristic = voice.get("Characteristic", "")
-                gender = voice.get("Inferred Gender", "")
-                
-                # Create display text with NEW EMOJI for gender
-                gender_emoji = ""
-                if "Nữ" in gender and "Nam" in gender:
-                    gender_emoji = "⚧️"  # Unisex voice
-                elif "Nữ" in gender:
-                    gender_emoji = "♀️"  # Female voice (purple circle)
-                elif "Nam" in gender:
-                    gender_emoji = "♂️"  # Male voice (blue circle)
-                else:
-                    gender_emoji = "⚪"  # Unknown gender (white circle)
-                
-                display_text = f"{gender_emoji} {voice_name} - {characteristic}"
-                self.voice_combo.addItem(display_text, voice_name)  # Store actual voice name as data
-        else:
-            self.voice_combo.addItem("❌ No voices loaded")
+        # Voices được load nền - xem _on_voices_loaded
+        self.voice_combo.addItem("⏳ Loading voices...")
+        voice_loader = VoiceLoadWorker()
+        voice_loader.signals.finished.connect(self._on_voices_loaded)
+        QThreadPool.globalInstance().start(voice_loader)
 
         voice_grid.addWidget(self.voice_combo, 0, 1, 1, 2)
 
@@ -2936,8 +3221,15 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         effects_layout.addWidget(self.chk_add_source, 1, 0)
         effects_layout.addWidget(self.chk_voice_over, 1, 1)
         
+        # Row 3 - bật được sau khi check_ffmpeg_installation tìm thấy encoder phần cứng
+        self.chk_gpu_encode = QCheckBox("⚡ Use GPU encoding")
+        self.chk_gpu_encode.setEnabled(False)
+        self.chk_gpu_encode.setToolTip("Checking for NVENC / QSV / AMF encoders...")
+        self.chk_gpu_encode.toggled.connect(self._on_gpu_encode_toggled)
+        effects_layout.addWidget(self.chk_gpu_encode, 2, 0, 1, 2)
+        
         # Apply styles to checkboxes
-        for chk in [self.chk_add_banner, self.chk_add_subtitle, self.chk_add_source, self.chk_voice_over]:
+        for chk in [self.chk_add_banner, self.chk_add_subtitle, self.chk_add_source, self.chk_voice_over, self.chk_gpu_encode]:
             chk.setObjectName("modernCheckbox")
         
         # Connect voice over checkbox to enable/disable voice controls (after checkbox is created)
@@ -3020,42 +3312,26 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
         return widget
     
+    def _schedule_preview_update(self, *_):
+        """Gom các valueChanged liên tiếp (giữ phím mũi tên, lăn chuột) thành 1 lần _update_preview_positions"""
+        self._preview_timer.start()
+
     def _connect_preview_signals(self):
         """Kết nối sự kiện valueChanged của các controls tới hàm cập nhật preview với safety checks."""
         
         try:
             connected_count = 0
             
-            # Banner signals - WITH SAFETY CHECKS
-            if hasattr(self, 'banner_x') and self.banner_x is not None:
-                self.banner_x.valueChanged.connect(self._update_preview_positions)
-                connected_count += 1
-                
-            if hasattr(self, 'banner_y') and self.banner_y is not None:
-                self.banner_y.valueChanged.connect(self._update_preview_positions)
-                connected_count += 1
-                
-            if hasattr(self, 'banner_height_ratio') and self.banner_height_ratio is not None:
-                self.banner_height_ratio.valueChanged.connect(self._update_preview_positions)
-                connected_count += 1
-
-            # 🔥 REMOVED: subtitle_x signal - không còn cần thiết
-            # Subtitle Y signal only - WITH SAFETY CHECK
-            if hasattr(self, 'subtitle_y') and self.subtitle_y is not None:
-                self.subtitle_y.valueChanged.connect(self._update_preview_positions)
-                connected_count += 1
-
-            # Source text signals - WITH SAFETY CHECKS
-            if hasattr(self, 'source_x') and self.source_x is not None:
-                self.source_x.valueChanged.connect(self._update_preview_positions)
-                connected_count += 1
-                
-            if hasattr(self, 'source_y') and self.source_y is not None:
-                self.source_y.valueChanged.connect(self._update_preview_positions)
-                connected_count += 1
+            # Banner, subtitle Y (subtitle_x đã bỏ - tự căn giữa) và source text - WITH SAFETY CHECKS
+            for name in PREVIEW_SPINBOX_NAMES:
+                spinbox = getattr(self, name, None)
+                if spinbox is not None:
+                    spinbox.valueChanged.connect(self._schedule_preview_update)
+                    connected_count += 1
             
-            self.add_log("SUCCESS", f"🔗 Real-time preview connections established: {connected_count} signals connected")
-            self.add_log("INFO", "📍 Subtitle positioning: Auto-centered horizontally, Y-position adjustable")
+            if self.log_enabled("INFO"):
+                self.add_log("SUCCESS", f"🔗 Real-time preview connections established: {connected_count} signals connected")
+                self.add_log("INFO", "📍 Subtitle positioning: Auto-centered horizontally, Y-position adjustable")
             
             # 🔥 TRIGGER INITIAL PREVIEW UPDATE AFTER CONNECTIONS
             if hasattr(self, '_update_preview_positions'):
@@ -3064,10 +3340,21 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 
         except Exception as e:
             self.add_log("ERROR", f"❌ Error connecting preview signals: {str(e)}")
-            import traceback
-            self.add_log("ERROR", f"   📋 Traceback: {traceback.format_exc()}")
+            self.add_log_exc("ERROR", "   📋 Traceback: ")
 
 
+    def _make_spin(self, name, minimum, maximum, value, suffix, step=None, spin_class=QSpinBox):
+        """Tạo spinbox chuẩn (objectName modernSpin) và gán vào self.<name>; caller tự add vào layout"""
+        spin = spin_class()
+        spin.setObjectName("modernSpin")
+        spin.setRange(minimum, maximum)
+        spin.setValue(value)
+        if step is not None:
+            spin.setSingleStep(step)
+        spin.setSuffix(suffix)
+        setattr(self, name, spin)
+        return spin
+
     def create_preview_tab(self):
         """Video preview and effects settings"""
         widget = QWidget()
@@ -3133,31 +3420,15 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         # Row 1: Position X
         banner_layout.addWidget(QLabel("Position X:"), 1, 0)
-        self.banner_x = QSpinBox()
-        self.banner_x.setObjectName("modernSpin")
-        self.banner_x.setRange(0, 1080)
-        self.banner_x.setValue(250)
-        self.banner_x.setSuffix(" px")
-        banner_layout.addWidget(self.banner_x, 1, 1)
+        banner_layout.addWidget(self._make_spin("banner_x", 0, 1080, 250, " px"), 1, 1)
         
         # Row 2: Position Y
         banner_layout.addWidget(QLabel("Position Y:"), 2, 0)
-        self.banner_y = QSpinBox()
-        self.banner_y.setObjectName("modernSpin")
-        self.banner_y.setRange(0, 1920)
-        self.banner_y.setValue(1550)
-        self.banner_y.setSuffix(" px")
-        banner_layout.addWidget(self.banner_y, 2, 1)
+        banner_layout.addWidget(self._make_spin("banner_y", 0, 1920, 1550, " px"), 2, 1)
         
         # Row 3: Banner height ratio
         banner_layout.addWidget(QLabel("Banner Height:"), 3, 0)
-        self.banner_height_ratio = QDoubleSpinBox()
-        self.banner_height_ratio.setObjectName("modernSpin")
-        self.banner_height_ratio.setRange(0.1, 0.8)
-        self.banner_height_ratio.setValue(0.6)
-        self.banner_height_ratio.setSingleStep(0.05)
-        self.banner_height_ratio.setSuffix(" ratio")
-        banner_layout.addWidget(self.banner_height_ratio, 3, 1, 1, 2)
+        banner_layout.addWidget(self._make_spin("banner_height_ratio", 0.1, 0.8, 0.6, " ratio", step=0.05, spin_class=QDoubleSpinBox), 3, 1, 1, 2)
         
         # Row 4: Timing section
         timing_frame = QFrame()
@@ -3165,22 +3436,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         timing_layout = QHBoxLayout(timing_frame)
         
         timing_layout.addWidget(QLabel("⏰ Show from:"))
-        self.banner_start_time = QSpinBox()
-        self.banner_start_time.setObjectName("modernSpin")
-        self.banner_start_time.setRange(0, 3600)
-        self.banner_start_time.setValue(0)
-        self.banner_start_time.setSuffix("s")
-        timing_layout.addWidget(self.banner_start_time)
+        timing_layout.addWidget(self._make_spin("banner_start_time", 0, 3600, 0, "s"))
         
         timing_layout.addWidget(QLabel("to:"))
-        self.banner_end_time = QSpinBox()
-        self.banner_end_time.setObjectName("modernSpin")
-        self.banner_end_time.setRange(1, 3600)
-        self.banner_end_time.setValue(60)
-        self.banner_end_time.setSuffix("s")
-        timing_layout.addWidget(self.banner_end_time)
+        timing_layout.addWidget(self._make_spin("banner_end_time", 1, 3600, 60, "s"))
         
         banner_layout.addWidget(timing_frame, 4, 0, 1, 3)
+        self._bind_banner_state()
         
         # Row 5: Chromakey settings
         chroma_frame = QFrame()
@@ -3197,19 +3459,17 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         chroma_layout.addWidget(QLabel("Color:"), 1, 0)
         self.chroma_color = QComboBox()
         self.chroma_color.setObjectName("modernCombo")
-        self.chroma_color.addItems(["Green (0x00ff00)", "Blue (0x0000ff)", "Black (0x000000)", "White (0xffffff)", "Red (0xff0000)"])
+        for label, color in CHROMA_COLORS:
+            self.chroma_color.addItem(label, color)
         self.chroma_color.setEnabled(True)
+        # Cache giá trị FFmpeg khi đổi lựa chọn - _get_chroma_color không phải hỏi widget
+        self.chroma_color.currentIndexChanged.connect(
+            lambda _: setattr(self, "_chroma_hex", self.chroma_color.currentData() or "0x00ff00"))
         chroma_layout.addWidget(self.chroma_color, 1, 1)
         
         # Chromakey tolerance
         chroma_layout.addWidget(QLabel("Tolerance:"), 1, 2)
-        self.chroma_tolerance = QSpinBox()
-        self.chroma_tolerance.setObjectName("modernSpin")
-        self.chroma_tolerance.setRange(0, 100)
-        self.chroma_tolerance.setValue(20)
-        self.chroma_tolerance.setSuffix("%")
-        self.chroma_tolerance.setEnabled(True)
-        chroma_layout.addWidget(self.chroma_tolerance, 1, 3)
+        chroma_layout.addWidget(self._make_spin("chroma_tolerance", 0, 100, 20, "%"), 1, 3)
         
         # Connect checkbox to enable/disable chromakey controls
         self.enable_chromakey.toggled.connect(lambda checked: [
@@ -3227,12 +3487,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         # Font Size
         subtitle_layout.addWidget(QLabel("Font Size:"), 0, 0)
-        self.subtitle_size = QSpinBox()
-        self.subtitle_size.setObjectName("modernSpin")
-        self.subtitle_size.setRange(10, 100)
-        self.subtitle_size.setValue(40)
-        self.subtitle_size.setSuffix("px")
-        subtitle_layout.addWidget(self.subtitle_size, 0, 1)
+        subtitle_layout.addWidget(self._make_spin("subtitle_size", 10, 100, 40, "px"), 0, 1)
         
         # INFO LABEL ABOUT CENTERING
         center_info = QLabel("📍 Horizontal Position: Auto-centered")
@@ -3242,12 +3497,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         # Position Y (vertical position still adjustable)
         subtitle_layout.addWidget(QLabel("Vertical Position Y:"), 2, 0)
-        self.subtitle_y = QSpinBox()
-        self.subtitle_y.setObjectName("modernSpin")
-        self.subtitle_y.setRange(0, 1920)
-        self.subtitle_y.setValue(1200)
-        self.subtitle_y.setSuffix(" px")
-        subtitle_layout.addWidget(self.subtitle_y, 2, 1)
+        subtitle_layout.addWidget(self._make_spin("subtitle_y", 0, 1920, 1200, " px"), 2, 1)
         
         # Style
         subtitle_layout.addWidget(QLabel("Style:"), 3, 0)
@@ -3314,30 +3564,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         position_layout = QGridLayout(position_frame)
         
         position_layout.addWidget(QLabel("Position X:"), 0, 0)
-        self.source_x = QSpinBox()
-        self.source_x.setObjectName("modernSpin")
-        self.source_x.setRange(0, 1080)
-        self.source_x.setValue(50)
-        self.source_x.setSingleStep(10)
-        self.source_x.setSuffix(" px")
-        position_layout.addWidget(self.source_x, 0, 1)
+        position_layout.addWidget(self._make_spin("source_x", 0, 1080, 50, " px", step=10), 0, 1)
         
         position_layout.addWidget(QLabel("Position Y:"), 1, 0)
-        self.source_y = QSpinBox()
-        self.source_y.setObjectName("modernSpin")
-        self.source_y.setRange(0, 1920)
-        self.source_y.setValue(50)
-        self.source_y.setSingleStep(10)
-        self.source_y.setSuffix(" px")
-        position_layout.addWidget(self.source_y, 1, 1)
+        position_layout.addWidget(self._make_spin("source_y", 0, 1920, 50, " px", step=10), 1, 1)
         
         position_layout.addWidget(QLabel("Font Size:"), 2, 0)
-        self.source_font_size = QSpinBox()
-        self.source_font_size.setObjectName("modernSpin")
-        self.source_font_size.setRange(10, 200)
-        self.source_font_size.setValue(14)
-        self.source_font_size.setSuffix("px")
-        position_layout.addWidget(self.source_font_size, 2, 1)
+        position_layout.addWidget(self._make_spin("source_font_size", 10, 200, 14, "px"), 2, 1)
         
         position_layout.addWidget(QLabel("Font Color:"), 3, 0)
         self.source_font_color = QComboBox()
@@ -3387,50 +3620,109 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
             self.add_log("SUCCESS", "✅ Processing completed!")
 
+    def _video_cache_key(self, video_path: str):
+        """Key của _dim_cache: (path, mtime_ns, size), hoặc None nếu file không tồn tại"""
+        video_stat = _stat_or_none(video_path)
+        return (video_path, video_stat.st_mtime_ns, video_stat.st_size) if video_stat else None
+
+    def _get_dim_cache(self) -> dict:
+        """_dim_cache, nạp từ PROBE_CACHE_PATH ở lần dùng đầu tiên"""
+        if self._dim_cache is None:
+            self._dim_cache = _load_probe_cache()
+        return self._dim_cache
+
+    def _store_video_dimensions(self, cache_key, dimensions):
+        """Ghi kết quả probe vào _dim_cache (gọi được từ thread probe) - lưu đĩa ở _save_dim_cache"""
+        cache = self._get_dim_cache()
+        with self._dim_cache_lock:
+            cache[cache_key] = dimensions
+            self._dim_cache_dirty = True
+
+    def _save_dim_cache(self):
+        """Lưu _dim_cache vào PROBE_CACHE_PATH nếu có thay đổi, bỏ các entry của file đã xóa/đã sửa"""
+        with self._dim_cache_lock:
+            if not self._dim_cache_dirty or self._dim_cache is None:
+                return
+            entries = {}
+            for (path, mtime_ns, size), (width, height) in list(self._dim_cache.items()):
+                if self._video_cache_key(path) != (path, mtime_ns, size):
+                    del self._dim_cache[(path, mtime_ns, size)]  # stale - file không còn như lúc probe
+                    continue
+                entries[path] = [mtime_ns, size, width, height]
+            self._dim_cache_dirty = False
+            try:
+                os.makedirs(os.path.dirname(PROBE_CACHE_PATH), exist_ok=True)
+                _write_text_atomic(PROBE_CACHE_PATH, json.dumps(entries))
+            except OSError:
+                pass  # Không lưu được thì vẫn còn cache trong bộ nhớ
+
+    def _probe_into_cache(self, video_path: str):
+        """Chạy trong _probe_executor: probe một file chưa có trong cache, lỗi thì bỏ qua"""
+        cache_key = self._video_cache_key(video_path)
+        if not cache_key or cache_key in self._get_dim_cache():
+            return
+        try:
+            self._store_video_dimensions(cache_key, _probe_dimensions(video_path))
+        except Exception:
+            pass  # get_video_dimensions sẽ probe lại và log lỗi khi xử lý file này
+
+    def prefetch_video_dimensions(self, video_paths):
+        """Probe trước kích thước các file trong ThreadPoolExecutor để lúc xử lý chỉ còn tra cache"""
+        self._get_dim_cache()  # nạp cache từ đĩa trên GUI thread trước khi các thread probe dùng
+        if self._probe_executor is None:
+            self._probe_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="probe")
+        futures = [self._probe_executor.submit(self._probe_into_cache, video_path) for video_path in video_paths]
+        
+        def on_probe_done(_future):
+            # Lưu đĩa một lần khi cả batch probe xong (callback nào tới sau cùng; lưu lặp là no-op)
+            if all(future.done() for future in futures):
+                self._save_dim_cache()
+        
+        for future in futures:
+            future.add_done_callback(on_probe_done)
+
+    def closeEvent(self, event):
+        """Dừng các probe còn chờ và lưu cache kích thước video trước khi đóng"""
+        if self._probe_executor is not None:
+            self._probe_executor.shutdown(wait=False, cancel_futures=True)
+        self._save_dim_cache()
+        super().closeEvent(event)
+
     def get_video_dimensions(self, video_path: str) -> tuple[int | None, int | None]:
         """
         Lấy kích thước thực tế của video - UNIVERSAL cho mọi kích thước.
         Returns: (width, height) hoặc (None, None) nếu lỗi
         """
         try:
-            import subprocess
-            
-            ffprobe_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ffmpeg", "bin", "ffprobe.exe")
+            # Cache theo (path, mtime, size) - file không đổi thì không chạy lại ffprobe
+            cache_key = self._video_cache_key(video_path)
+            cached = self._get_dim_cache().get(cache_key)
+            if cached:
+                return cached
             
-            if not os.path.exists(ffprobe_path):
-                self.add_log("ERROR", f"❌ FFprobe not found: {ffprobe_path}")
+            try:
+                width, height = _probe_dimensions(video_path)
+            except RuntimeError as e:
+                self.add_log("ERROR", f"❌ {e}")
                 return None, None
             
-            probe_cmd = [
-                ffprobe_path,
-                "-v", "error",
-                "-select_streams", "v:0",
-                "-show_entries", "stream=width,height",
-                "-of", "csv=p=0",
-                video_path
-            ]
-            
-            result = subprocess.run(probe_cmd, capture_output=True, text=True, timeout=10)
-            
-            if result.returncode == 0:
-                try:
-                    output_parts = result.stdout.strip().split(',')
-                    if len(output_parts) >= 2:
-                        width = int(output_parts[0])
-                        height = int(output_parts[1])
-                        self.add_log("INFO", f"📐 Video dimensions detected: {width}x{height}")
-                        return width, height
-                except (ValueError, IndexError):
-                    self.add_log("ERROR", f"❌ Cannot parse dimensions: {result.stdout}")
-            else:
-                self.add_log("ERROR", f"❌ FFprobe error: {result.stderr}")
-            
-            return None, None
+            self.add_log("INFO", f"📐 Video dimensions detected: {width}x{height}")
+            if cache_key:
+                self._store_video_dimensions(cache_key, (width, height))
+            return width, height
             
         except Exception as e:
             self.add_log("ERROR", f"❌ Error getting video dimensions: {str(e)}")
             return None, None
 
+    def _bind_banner_state(self):
+        """Đồng bộ self._banner_state với các spinbox banner để phần tính toán không phải gọi .value()"""
+        state = self._banner_state
+        for widget, field in ((self.banner_x, "x"), (self.banner_y, "y"), (self.banner_height_ratio, "ratio"),
+                              (self.banner_start_time, "start"), (self.banner_end_time, "end")):
+            setattr(state, field, widget.value())
+            widget.valueChanged.connect(lambda value, field=field: setattr(state, field, value))
+
     def calculate_universal_banner_params(self, video_width: int, video_height: int) -> dict | None:
         """🔥 FIXED: Tính toán banner params với validation đầy đủ"""
         try:
@@ -3439,20 +3731,13 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 self.add_log("ERROR", f"❌ Invalid video dimensions: {video_width}x{video_height}")
                 return None
             
-            # Reference size
-            REFERENCE_WIDTH = 1080
-            REFERENCE_HEIGHT = 1920
-            
-            # 🔥 Lấy và validate GUI values
-            try:
-                gui_x = self.banner_x.value()
-                gui_y = self.banner_y.value()
-                gui_height_ratio = self.banner_height_ratio.value()
-                gui_start_time = self.banner_start_time.value()
-                gui_end_time = self.banner_end_time.value()
-            except Exception as e:
-                self.add_log("ERROR", f"❌ Error reading GUI values: {str(e)}")
-                return None
+            # 🔥 Lấy GUI values từ BannerState (đồng bộ qua valueChanged, không thể raise)
+            state = self._banner_state
+            gui_x = state.x
+            gui_y = state.y
+            gui_height_ratio = state.ratio
+            gui_start_time = state.start
+            gui_end_time = state.end
             
             # Validation
             if gui_height_ratio <= 0 or gui_height_ratio > 1:
@@ -3463,26 +3748,12 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             width_scale = video_width / REFERENCE_WIDTH
             height_scale = video_height / REFERENCE_HEIGHT
             
-            # Position mapping
-            actual_x = int(gui_x * width_scale)
-            actual_y = int(gui_y * height_scale)
-            
-            # Banner size calculations
-            actual_banner_height = int(video_height * gui_height_ratio)
-            actual_banner_width = int(actual_banner_height * 16/9)  # 16:9 aspect ratio
-            
-            # Boundary checks
-            if actual_banner_width > video_width:
-                actual_banner_width = int(video_width * 0.9)
-                actual_banner_height = int(actual_banner_width * 9/16)
+            final_x, final_y, actual_banner_width, actual_banner_height, width_adjusted = _banner_geometry(
+                video_width, video_height, gui_x, gui_y, gui_height_ratio
+            )
+            if width_adjusted:
                 self.add_log("WARNING", f"⚠️ Banner width adjusted to fit video: {actual_banner_width}x{actual_banner_height}")
             
-            # Position clamping
-            max_x = max(0, video_width - actual_banner_width)
-            max_y = max(0, video_height - actual_banner_height)
-            final_x = max(0, min(actual_x, max_x))
-            final_y = max(0, min(actual_y, max_y))
-            
             # 🔥 Get chroma settings safely
             chroma_color = self._get_chroma_color()
             chroma_similarity = self.chroma_tolerance.value() / 100.0 if hasattr(self, 'chroma_tolerance') else 0.2
@@ -3500,19 +3771,20 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 "end_time": gui_end_time
             }
             
-            # Detailed logging
-            self.add_log("SUCCESS", f"🎯 Banner parameters calculated successfully:")
-            self.add_log("INFO", f"   📐 Video: {video_width}x{video_height}")
-            self.add_log("INFO", f"   📏 Scale: {width_scale:.3f}x, {height_scale:.3f}x")
-            self.add_log("INFO", f"   📍 Position: ({gui_x}, {gui_y}) → ({final_x}, {final_y})")
-            self.add_log("INFO", f"   📐 Banner: {actual_banner_width}x{actual_banner_height} ({gui_height_ratio*100:.1f}%)")
+            # Detailed logging - chỉ format khi log INFO được hiển thị
+            if self.log_enabled("INFO"):
+                self.add_log("SUCCESS", "🎯 Banner parameters calculated successfully:")
+                self.add_log("INFO", self._BANNER_CALC_LOG_TMPL.format(
+                    video_width=video_width, video_height=video_height,
+                    width_scale=width_scale, height_scale=height_scale,
+                    gui_x=gui_x, gui_y=gui_y, ratio_percent=gui_height_ratio * 100, **params
+                ))
             
             return params
             
         except Exception as e:
             self.add_log("ERROR", f"❌ Banner calculation error: {str(e)}")
-            import traceback
-            self.add_log("ERROR", f"   📋 Traceback: {traceback.format_exc()}")
+            self.add_log_exc("ERROR", "   📋 Traceback: ")
             return None
 
     def _get_chroma_color(self) -> str:
@@ -3520,25 +3792,20 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         if not self.enable_chromakey.isChecked():
             return "none"
         
-        chroma_map = {
-            "Green (0x00ff00)": "0x00ff00",
-            "Blue (0x0000ff)": "0x0000ff", 
-            "Black (0x000000)": "0x000000",
-            "White (0xffffff)": "0xffffff",
-            "Red (0xff0000)": "0xff0000"
-        }
-        selected = self.chroma_color.currentText()
-        return chroma_map.get(selected, "0x00ff00")
+        # Giá trị FFmpeg của item đang chọn (xem CHROMA_COLORS), cập nhật qua currentIndexChanged
+        return self._chroma_hex
 
     
     def process_banner_with_universal_mapping(self, main_video_path: str, banner_video_path: str, output_path: str) -> bool:
         """🔥 FIXED: Xử lý banner với mapping chính xác cho mọi kích thước video"""
         try:
+            video_name = os.path.basename(main_video_path)
+            
             # Step 1: Lấy kích thước video
             video_width, video_height = self.get_video_dimensions(main_video_path)
             
             if video_width is None or video_height is None:
-                self.add_log("ERROR", f"❌ Cannot determine video size: {os.path.basename(main_video_path)}")
+                self.add_log("ERROR", f"❌ Cannot determine video size: {video_name}")
                 return False
             
             # Step 2: Tính toán thông số universal
@@ -3565,31 +3832,29 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             }
             
             # Step 5: Log final parameters
-            self.add_log("INFO", f"🎬 Final FFmpeg parameters for {os.path.basename(main_video_path)}:")
-            self.add_log("INFO", f"   ➡️ Position: ({final_params['position_x']}, {final_params['position_y']})")
-            self.add_log("INFO", f"   ➡️ Banner Size: {final_params['banner_width']}x{final_params['banner_height']} pixels")
-            self.add_log("INFO", f"   ➡️ Chroma: {final_params['chroma_color']}, Similarity: {final_params['similarity']}")
-            self.add_log("INFO", f"   ➡️ Timing: {final_params['start_time']}s to {final_params['end_time']}s")
+            if self.log_enabled("INFO"):
+                self.add_log("INFO", self._BANNER_FFMPEG_LOG_TMPL.format(
+                    file_name=video_name, **final_params
+                ))
             
             # Step 6: Gọi hàm xử lý banner
             success = self.run_banner_processing(main_video_path, banner_video_path, output_path, final_params)
             
             if success:
-                self.add_log("SUCCESS", f"✅ Banner processing completed: {os.path.basename(main_video_path)}")
+                self.add_log("SUCCESS", f"✅ Banner processing completed: {video_name}")
             else:
-                self.add_log("ERROR", f"❌ Banner processing failed: {os.path.basename(main_video_path)}")
+                self.add_log("ERROR", f"❌ Banner processing failed: {video_name}")
             
             return success
             
         except Exception as e:
             self.add_log("ERROR", f"❌ Universal banner processing error: {str(e)}")
-            import traceback
-            self.add_log("ERROR", f"   📋 Traceback: {traceback.format_exc()}")
+            self.add_log_exc("ERROR", "   📋 Traceback: ")
             return False
         
     def start_processing(self):
         """Begin batch video processing - CHỈ setup và start worker thread"""
-        if self.file_list.count() == 0:
+        if self._file_model.rowCount() == 0:
             self.add_log("WARNING", "⚠️ No files selected for processing")
             return
 
@@ -3603,9 +3868,14 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             self.add_log("ERROR", "❌ Output directory not found")
             return
 
+        # Đọc trạng thái checkbox / banner path một lần - dùng cho cả validate lẫn settings
+        add_subtitle = self.chk_add_subtitle.isChecked()
+        add_banner = self.chk_add_banner.isChecked()
+        add_source = self.chk_add_source.isChecked()
+        banner_path = self.banner_path.text().strip()
 
         # Validate API key nếu subtitle được bật
-        if self.chk_add_subtitle.isChecked():
+        if add_subtitle:
             api_key_1, api_key_2 = self.get_dual_api_keys()
             if not api_key_1:
                 self.add_log("ERROR", "❌ At least one API key required for subtitle processing")
@@ -3617,8 +3887,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 self.add_log("SUCCESS", "✅ DUAL API keys validated - ready for parallel processing!")
 
         # Validate banner file nếu banner được bật
-        if self.chk_add_banner.isChecked():
-            banner_path = self.banner_path.text().strip()
+        if add_banner:
             if not banner_path or not os.path.exists(banner_path):
                 self.add_log("ERROR", "❌ Banner file required for banner processing")
                 return
@@ -3628,35 +3897,37 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         try:
             # Collect files to process
-            files_to_process = []
-            for i in range(self.file_list.count()):
-                item_text = self.file_list.item(i).text().split("📹 ")[-1]
-                files_to_process.append(item_text)
+            files_to_process = self._file_model.paths()
+
+            # Probe kích thước song song trong nền - worker chỉ còn tra cache
+            if add_banner or add_source:
+                self.prefetch_video_dimensions(files_to_process)
 
             # Collect ALL settings để pass cho worker
+            banner_state = self._banner_state
             settings = {
-                'add_banner': self.chk_add_banner.isChecked(),
-                'add_subtitle': self.chk_add_subtitle.isChecked(),
-                'add_source': self.chk_add_source.isChecked(),
+                'add_banner': add_banner,
+                'add_subtitle': add_subtitle,
+                'add_source': add_source,
                 'add_voice': self.chk_voice_over.isChecked(),
-                'api_key': self.get_validated_api_key() if self.chk_add_subtitle.isChecked() else '',
-                'source_lang': self.source_lang.currentText(),
-                'target_lang': self.target_lang.currentText(),
-                'banner_path': self.banner_path.text().strip(),
-                'banner_x': self.banner_x.value(),
-                'banner_y': self.banner_y.value(),
-                'banner_height_ratio': self.banner_height_ratio.value(),
-                'banner_start_time': self.banner_start_time.value(),
-                'banner_end_time': self.banner_end_time.value(),
+                'api_key': self.get_validated_api_key() if add_subtitle else '',
+                'source_lang': sys.intern(self.source_lang.currentText()),
+                'target_lang': sys.intern(self.target_lang.currentText()),
+                'banner_path': banner_path,
+                'banner_x': banner_state.x,
+                'banner_y': banner_state.y,
+                'banner_height_ratio': banner_state.ratio,
+                'banner_start_time': banner_state.start,
+                'banner_end_time': banner_state.end,
                 'chroma_color': self._get_chroma_color(),
                 'chroma_tolerance': self.chroma_tolerance.value(),
                 'enable_chromakey': self.enable_chromakey.isChecked(),
                 'source_mode_filename': hasattr(self, 'source_mode_filename') and self.source_mode_filename.isChecked(),
-                'source_text': self.source_text.text().strip() if hasattr(self, 'source_text') else '',
-                'source_x': self.source_x.value() if hasattr(self, 'source_x') else 50,
-                'source_y': self.source_y.value() if hasattr(self, 'source_y') else 50,
-                'source_font_size': self.source_font_size.value() if hasattr(self, 'source_font_size') else 14,
-                'source_font_color': self.source_font_color.currentText() if hasattr(self, 'source_font_color') else 'white',
+                'source_text': self.source_text.text().strip() if self.source_text is not None else '',
+                'source_x': self.source_x.value() if self.source_x is not None else 50,
+                'source_y': self.source_y.value() if self.source_y is not None else 50,
+                'source_font_size': self.source_font_size.value() if self.source_font_size is not None else 14,
+                'source_font_color': self.source_font_color.currentText() if self.source_font_color is not None else 'white',
                 'subtitle_size': self.subtitle_size.value(),
                 'subtitle_y': self.subtitle_y.value(),
                 'subtitle_style': self.subtitle_style.currentText()
@@ -3677,11 +3948,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                 self.add_log("INFO", f"🎨 Effects: {', '.join(effects)}")
 
             # Clear and setup queue
-            if hasattr(self, 'queue_list'):
-                self.queue_list.clear()
-                for file_path in files_to_process:
-                    queue_item = QListWidgetItem(f"⏳ {os.path.basename(file_path)}")
-                    self.queue_list.addItem(queue_item)
+            self._queue_model.set_paths(files_to_process)
 
             # 🔥 Setup và start worker - ĐÂY LÀ ĐIỂM QUAN TRỌNG
             self.processing_worker.setup_processing(files_to_process, output_dir, settings)
@@ -3765,8 +4032,9 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         queue_group.setObjectName("modernGroupBox")
         queue_layout = QVBoxLayout(queue_group)
         
-        self.queue_list = QListWidget()
+        self.queue_list = QListView()
         self.queue_list.setObjectName("modernList")
+        self.queue_list.setModel(self._queue_model)
         queue_layout.addWidget(self.queue_list)
         
         queue_controls = QHBoxLayout()
@@ -3807,12 +4075,21 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         btn_auto_scroll.setCheckable(True)
         btn_auto_scroll.setChecked(True)
         
+        # Level tối thiểu được log - level thấp hơn bị bỏ qua trước khi format message (xem log_enabled)
+        self.log_level_combo = QComboBox()
+        self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR"])
+        self.log_level_combo.setCurrentText(self.min_log_level)
+        self.log_level_combo.setToolTip("Minimum level shown in the log")
+        
         btn_clear_logs.clicked.connect(self.clear_logs)
         btn_save_logs.clicked.connect(self.save_logs)
+        self.log_level_combo.currentTextChanged.connect(self.set_min_log_level)
         
         log_controls.addWidget(btn_clear_logs)
         log_controls.addWidget(btn_save_logs)
         log_controls.addWidget(btn_auto_scroll)
+        log_controls.addWidget(QLabel("Log level:"))
+        log_controls.addWidget(self.log_level_combo)
         log_controls.addStretch()
         
         layout.addLayout(log_controls)
@@ -3821,6 +4098,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         self.log_text = QTextBrowser()
         self.log_text.setObjectName("modernLog")
         self.log_text.setFont(QFont("Consolas", 10))
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
         layout.addWidget(self.log_text)
         
         # Initialize with sample logs
@@ -3860,23 +4138,21 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         try:
             # Construct path to the stylesheet relative to the script
             # os.path.dirname(__file__) gets the directory of the current script
-            style_sheet_path = os.path.join(os.path.dirname(__file__), 'styles.qss')
+            style_sheet_path = os.path.join(current_dir, 'styles.qss')
             
-            with open(style_sheet_path, "r", encoding='utf-8') as f:
-                stylesheet = f.read()
+            with open(style_sheet_path, "rb") as f:
+                stylesheet = f.read().decode('utf-8')
             
             self.setStyleSheet(stylesheet)
             print("✅ Successfully loaded external stylesheet: styles.qss")
 
         except FileNotFoundError:
             print(f"❌ ERROR: Stylesheet 'styles.qss' not found. Make sure it's in the same directory as the script.")
-            # Optionally add a log message if the log system is ready
-            if hasattr(self, 'log_text'):
-                self.add_log("ERROR", "Could not find styles.qss. UI may appear unstyled.")
+            # Log được buffer và hiện khi log_text đã tạo (xem _flush_logs)
+            self.add_log("ERROR", "Could not find styles.qss. UI may appear unstyled.")
         except Exception as e:
             print(f"❌ ERROR: Failed to load stylesheet: {e}")
-            if hasattr(self, 'log_text'):
-                self.add_log("ERROR", f"Failed to load stylesheet: {e}")
+            self.add_log("ERROR", f"Failed to load stylesheet: {e}")
 
     
     def toggle_preview_area(self, area_type):
@@ -3890,8 +4166,22 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         
         self.video_preview.update()
     
+    def log_enabled(self, level):
+        """True nếu log ở level này sẽ được hiển thị - dùng để bỏ qua việc format message đắt tiền"""
+        order = self._LOG_LEVEL_ORDER
+        return order.get(level, 1) >= order[self.min_log_level]
+
+    def set_min_log_level(self, level):
+        """Đổi level log tối thiểu (combo Log level) - có hiệu lực ngay cả với thread worker"""
+        if level not in self._LOG_LEVEL_ORDER:
+            return
+        self.min_log_level = level
+        self.add_log("INFO", f"📋 Log level: {level}")
+    
     def add_log(self, level, message):
         """Add formatted log entry with timestamp and color - FIXED SYNC"""
+        if not self.log_enabled(level):
+            return
         color_map = {
             "INFO": "#0A86DE",
             "SUCCESS": "#68d391", 
@@ -3903,20 +4193,45 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
         color = color_map.get(level, "#e2e8f0")
         
         # 🔥 FIX: Lấy thời gian thực từ hệ thống
-        import datetime
-        now = datetime.datetime.now()
-        timestamp = now.strftime("%H:%M:%S")  # Format: 14:35:42
+        timestamp = time.strftime("%H:%M:%S")  # Format: 14:35:42 (giờ local)
         
         formatted_msg = f'<span style="color: {color};">[{timestamp}] [{level}]</span> {message}'
         
-        # Thêm vào log display
-        if hasattr(self, 'log_text') and self.log_text is not None:
-            self.log_text.append(formatted_msg)
-            
-            # Auto scroll to bottom if enabled
-            if hasattr(self, 'auto_scroll_enabled') and self.auto_scroll_enabled:
-                scrollbar = self.log_text.verticalScrollBar()
-                scrollbar.setValue(scrollbar.maximum())
+        # Chỉ đưa vào buffer - _flush_logs append vào log display mỗi 100ms (gọi được từ thread khác)
+        self._log_buffer.append(formatted_msg)
+    
+    def _flush_logs(self):
+        """Append các log đang chờ trong _log_buffer vào log_text trong một edit block (một lần layout + scroll)"""
+        if not self._log_buffer or getattr(self, 'log_text', None) is None:
+            return
+        
+        # Mỗi dòng log là một block riêng để setMaximumBlockCount(LOG_MAX_BLOCKS) giới hạn theo DÒNG
+        document = self.log_text.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.beginEditBlock()
+        needs_new_block = not document.isEmpty()
+        while self._log_buffer:
+            if needs_new_block:
+                # Block mới không kế thừa màu của span trước đó
+                cursor.insertBlock()
+                cursor.setCharFormat(QTextCharFormat())
+            cursor.insertHtml(self._log_buffer.popleft())
+            needs_new_block = True
+        cursor.endEditBlock()
+        
+        # Auto scroll to bottom if enabled
+        if hasattr(self, 'auto_scroll_enabled') and self.auto_scroll_enabled:
+            scrollbar = self.log_text.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+    
+    def add_log_exc(self, level, message):
+        """Log traceback của exception đang xử lý - chỉ format khi level này đang được log"""
+        # Không kiểm tra widget ở đây: hàm được gọi từ thread worker, và traceback phải giữ lại
+        # kể cả khi tab Logs không mở để còn chẩn đoán sau batch
+        if not self.log_enabled(level):
+            return
+        self.add_log(level, f"{message}{traceback.format_exc()}")
     
     # Event Handlers
     def add_files(self):
@@ -3925,34 +4240,29 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             self, "Select 9:16 Video Files", "", 
             "Video Files (*.mp4 *.avi *.mov *.mkv);;All Files (*)"
         )
-        for file in files:
-            self.file_list.addItem(f"📹 {file}")
+        self._file_model.add_paths(files)
         self.add_log("INFO", f"Added {len(files)} video files")
     
     def add_folder(self):
         """Add entire folder of videos"""
         folder = QFileDialog.getExistingDirectory(self, "Select Video Folder")
         if folder:
-            # Danh sách các extension video được hỗ trợ
-            video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.m4v']
+            video_extensions = VIDEO_EXTENSIONS
             
             found_videos = []
             
             # Quét tất cả files trong folder
             try:
-                for filename in os.listdir(folder):
-                    file_path = os.path.join(folder, filename)
-                    
-                    # Kiểm tra nếu là file (không phải folder) và có extension video
-                    if os.path.isfile(file_path):
-                        file_ext = os.path.splitext(filename)[1].lower()
-                        if file_ext in video_extensions:
-                            found_videos.append(file_path)
+                # scandir trả về loại entry cùng lúc đọc thư mục - không cần stat riêng từng file
+                with os.scandir(folder) as entries:
+                    for entry in entries:
+                        # Kiểm tra nếu là file (không phải folder) và có extension video
+                        if entry.is_file() and os.path.splitext(entry.name)[1].lower() in video_extensions:
+                            found_videos.append(entry.path)
                 
                 # Thêm các video files vào list
                 if found_videos:
-                    for video_file in found_videos:
-                        self.file_list.addItem(f"📹 {video_file}")
+                    self._file_model.add_paths(found_videos)
                     
                     self.add_log("SUCCESS", f"✅ Added {len(found_videos)} video files from folder")
                     self.add_log("INFO", f"📁 Folder scanned: {folder}")
@@ -3962,7 +4272,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
                         self.add_log("INFO", f"   📹 {os.path.basename(video)}")
                 else:
                     self.add_log("WARNING", f"⚠️ No video files found in folder: {folder}")
-                    self.add_log("INFO", f"   Supported formats: {', '.join(video_extensions)}")
+                    self.add_log("INFO", f"   Supported formats: {', '.join(sorted(video_extensions))}")
                     
             except PermissionError:
                 self.add_log("ERROR", f"❌ Permission denied: Cannot access folder {folder}")
@@ -3973,7 +4283,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
     
     def clear_files(self):
         """Remove all files from processing list"""
-        self.file_list.clear()
+        self._file_model.clear()
         self.add_log("INFO", "Cleared all files from list")
     
     def browse_output(self):
@@ -4000,18 +4310,48 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
     def check_ffmpeg_installation(self):
         """Kiểm tra xem FFmpeg có sẵn không"""
-        ffmpeg_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ffmpeg", "bin", "ffmpeg.exe")
-        
-        if os.path.exists(ffmpeg_path):
-            self.add_log("SUCCESS", f"✅ FFmpeg found at: {ffmpeg_path}")
+        if FFMPEG_AVAILABLE:
+            self.add_log("SUCCESS", f"✅ FFmpeg found at: {FFMPEG_PATH}")
+            # Dò encoder GPU trong nền, kết quả về _on_hw_encoder_detected
+            encoder_probe = EncoderProbeWorker()
+            encoder_probe.signals.finished.connect(self._on_hw_encoder_detected)
+            QThreadPool.globalInstance().start(encoder_probe)
             return True
         else:
-            self.add_log("ERROR", f"❌ FFmpeg not found at: {ffmpeg_path}")
+            self.add_log("ERROR", f"❌ FFmpeg not found at: {FFMPEG_PATH}")
             self.add_log("ERROR", "   Please ensure FFmpeg is properly installed in the ffmpeg/bin/ directory.")
             return False
 
+    def _on_hw_encoder_detected(self, hwaccel):
+        """Nhận kết quả EncoderProbeWorker - bật checkbox GPU encoding nếu có encoder dùng được"""
+        self._hw_encoder = hwaccel
+        if hwaccel is None:
+            self.chk_gpu_encode.setToolTip("No usable hardware H.264 encoder found")
+            self.add_log("INFO", "ℹ️ No GPU encoder available - using libx264")
+            return
+        encoder = HW_VIDEO_CODEC_ARGS[hwaccel][1]  # tên encoder FFmpeg, ví dụ h264_nvenc
+        self.chk_gpu_encode.setEnabled(True)
+        self.chk_gpu_encode.setText(f"⚡ Use GPU encoding ({encoder})")
+        self.chk_gpu_encode.setToolTip("")
+        self.chk_gpu_encode.setChecked(True)
+        self.add_log("SUCCESS", f"⚡ GPU encoder available: {encoder}")
+    
+    def _encode_video_args(self):
+        """Tham số encode video hiện tại kèm -threads của batch đang chạy (nếu có)"""
+        if self._ffmpeg_threads:
+            return (*self._video_codec_args, "-threads", str(self._ffmpeg_threads))
+        return self._video_codec_args
+    
+    def _on_gpu_encode_toggled(self, checked):
+        """Chọn tham số encode video cho các lệnh FFmpeg tiếp theo"""
+        use_gpu = checked and self._hw_encoder is not None
+        # Cùng một bảng HW_VIDEO_CODEC_ARGS cho banner/subtitle và add_source_text_to_video
+        self._video_codec_args = tuple(HW_VIDEO_CODEC_ARGS[self._hw_encoder]) if use_gpu else X264_VIDEO_CODEC_ARGS
+        self._source_hwaccel = self._hw_encoder if use_gpu else None
+    
     def clear_logs(self):
         """Clear all log entries"""
+        self._log_buffer.clear()
         self.log_text.clear()
         self.add_log("INFO", "📋 Logs cleared")
     
@@ -4103,40 +4443,21 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
     def calculate_universal_source_params(self, video_width: int, video_height: int) -> dict:
         """ NEW: Tính toán source text params với universal mapping"""
         try:
-            # Reference size (1080x1920)
-            REFERENCE_WIDTH = 1080
-            REFERENCE_HEIGHT = 1920
-            
             # Input validation
             if video_width <= 0 or video_height <= 0:
                 self.add_log("ERROR", f"❌ Invalid video dimensions: {video_width}x{video_height}")
                 return None
             
-            # 🔥 Lấy GUI values với safety checks
-            gui_x = self.source_x.value() if hasattr(self, 'source_x') and self.source_x is not None else 50
-            gui_y = self.source_y.value() if hasattr(self, 'source_y') and self.source_y is not None else 50
-            gui_font_size = self.source_font_size.value() if hasattr(self, 'source_font_size') and self.source_font_size is not None else 14
-            gui_font_color = self.source_font_color.currentText() if hasattr(self, 'source_font_color') and self.source_font_color is not None else "white"
+            # 🔥 Lấy GUI values - các attribute luôn tồn tại (None trước khi tạo widget, xem __init__)
+            gui_x = self.source_x.value() if self.source_x is not None else 50
+            gui_y = self.source_y.value() if self.source_y is not None else 50
+            gui_font_size = self.source_font_size.value() if self.source_font_size is not None else 14
+            gui_font_color = self.source_font_color.currentText() if self.source_font_color is not None else "white"
             
             # 🔥 SCALING CALCULATIONS
-            width_scale = video_width / REFERENCE_WIDTH
-            height_scale = video_height / REFERENCE_HEIGHT
-            
-            # Scale position
-            actual_x = int(gui_x * width_scale)
-            actual_y = int(gui_y * height_scale)
-            
-            # Scale font size (use minimum scale to maintain readability)
-            font_scale = min(width_scale, height_scale)
-            actual_font_size = max(8, int(gui_font_size * font_scale))  # Minimum 8px
-            
-            # Boundary checks - ensure text doesn't go off screen
-            text_width_estimate = len("Source: Example Text") * actual_font_size * 0.6  # Rough estimation
-            max_x = max(0, video_width - int(text_width_estimate))
-            max_y = max(actual_font_size, video_height - actual_font_size)  # Keep within bounds
-            
-            final_x = max(0, min(actual_x, max_x))
-            final_y = max(actual_font_size, min(actual_y, max_y))
+            final_x, final_y, actual_font_size, width_scale, height_scale, font_scale = _source_geometry(
+                video_width, video_height, gui_x, gui_y, gui_font_size
+            )
             
             # 🔥 Build parameters
             params = {
@@ -4160,8 +4481,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
             
         except Exception as e:
             self.add_log("ERROR", f"❌ Source text calculation error: {str(e)}")
-            import traceback
-            self.add_log("ERROR", f"   📋 Traceback: {traceback.format_exc()}")
+            self.add_log_exc("ERROR", "   📋 Traceback: ")
             return None
 if __name__ == '__main__':
     app = QApplication(sys.argv)
@@ -7,11 +7,157 @@ FIXES:
 """
 
 import os
+import shutil
 import subprocess
 import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Tuple, Optional, List
 
+# Pillow measures real glyph advances for the boundary check; without it we fall back
+# to the rough len(text) * font_size * 0.6 estimate
+try:
+    from PIL import ImageFont
+except ImportError:
+    ImageFont = None
 
+
+# libx264 presets accepted by add_source_text_to_video (fastest -> slowest).
+# "faster" is the default: drawtext is cheap, so encode speed dominates each job.
+X264_PRESETS = ("ultrafast", "superfast", "veryfast", "faster", "fast", "medium")
+DEFAULT_X264_PRESET = "faster"
+
+# Lines of FFmpeg stderr kept for error messages (the rest is discarded while streaming)
+STDERR_TAIL_LINES = 20
+
+# FFmpeg threads per file in process_source_text_batch; the batch runs cpu_count // this files at once
+DEFAULT_THREADS_PER_JOB = 4
+
+# Hardware H.264 encoders (hwaccel name -> FFmpeg video codec args), in detection order.
+# drawtext runs on the CPU either way; only the encode moves to the GPU.
+# The GUI imports this table and detect_hwaccel for its banner/subtitle encodes too.
+HW_VIDEO_CODEC_ARGS = {
+    "nvenc": ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", "23", "-b:v", "0"],
+    "qsv": ["-c:v", "h264_qsv", "-preset", "fast", "-global_quality", "23"],
+    "amf": ["-c:v", "h264_amf", "-quality", "balanced", "-rc", "cqp", "-qp_i", "23", "-qp_p", "23"],
+}
+
+
+def x264_video_codec_args(preset: str) -> Tuple[str, ...]:
+    """libx264 (CPU) video codec args at the given preset - the only place the CPU CRF is set"""
+    return ("-c:v", "libx264", "-preset", preset, "-crf", "23")
+
+
+# CPU encode args for the banner/subtitle encodes (banner.py and the GUI import this)
+X264_VIDEO_CODEC_ARGS = x264_video_codec_args("fast")
+
+
+@lru_cache(maxsize=None)
+def detect_hwaccel(ffmpeg_executable: str) -> Optional[str]:
+    """
+    Find the first hardware encoder in HW_VIDEO_CODEC_ARGS that this FFmpeg build
+    lists AND can actually open (result cached per executable)
+    
+    Args:
+        ffmpeg_executable (str): Path to FFmpeg executable
+        
+    Returns:
+        Optional[str]: "nvenc", "qsv", "amf" or None if only CPU encoding is available
+    """
+    try:
+        listed = subprocess.run(
+            [ffmpeg_executable, "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    
+    for hwaccel, codec_args in HW_VIDEO_CODEC_ARGS.items():
+        if codec_args[1] not in listed:
+            continue
+        # Listed is not enough - the encoder fails to open without a matching GPU/driver
+        test_cmd = [
+            ffmpeg_executable, "-hide_banner", "-v", "error",
+            "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+            "-frames:v", "1", *codec_args, "-f", "null", "-"
+        ]
+        try:
+            if subprocess.run(test_cmd, capture_output=True, timeout=15).returncode == 0:
+                return hwaccel
+        except (OSError, subprocess.SubprocessError):
+            continue
+    return None
+
+def find_ffprobe(ffmpeg_executable: str) -> Optional[str]:
+    """
+    Locate ffprobe next to the given FFmpeg executable, falling back to PATH
+    
+    Args:
+        ffmpeg_executable (str): Path to FFmpeg executable
+        
+    Returns:
+        Optional[str]: Path to ffprobe or None if not found
+    """
+    ffmpeg_dir, ffmpeg_name = os.path.split(ffmpeg_executable)
+    ffprobe_path = os.path.join(ffmpeg_dir, "ffprobe" + os.path.splitext(ffmpeg_name)[1])
+    if os.path.exists(ffprobe_path):
+        return ffprobe_path
+    return shutil.which("ffprobe")
+
+
+@lru_cache(maxsize=1024)
+def _probe_video_dimensions(video_path: str, ffprobe_executable: str,
+                            mtime_ns: int, file_size: int) -> Optional[Tuple[int, int]]:
+    # mtime_ns/file_size are only part of the cache key, so a rewritten file is probed again
+    try:
+        result = subprocess.run(
+            [ffprobe_executable, "-v", "error", "-select_streams", "v:0",
+             "-show_entries", "stream=width,height", "-of", "csv=p=0", video_path],
+            capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    try:
+        width, height = (int(value) for value in result.stdout.strip().split(",")[:2])
+    except ValueError:
+        return None
+    return width, height
+
+
+def get_video_dimensions(video_path: str, ffmpeg_executable: str) -> Optional[Tuple[int, int]]:
+    """
+    Get the width and height of the first video stream with ffprobe
+    (cached per file path, modification time and size)
+    
+    Args:
+        video_path (str): Path to video file
+        ffmpeg_executable (str): Path to FFmpeg executable (ffprobe is looked up next to it)
+        
+    Returns:
+        Optional[Tuple[int, int]]: (width, height) or None if the video could not be probed
+    """
+    ffprobe_executable = find_ffprobe(ffmpeg_executable)
+    if not ffprobe_executable:
+        return None
+    try:
+        stat = os.stat(video_path)
+    except OSError:
+        return None
+    return _probe_video_dimensions(video_path, ffprobe_executable, stat.st_mtime_ns, stat.st_size)
+
+# Filename patterns used by extract_source_from_filename (compiled once)
+PROCESSING_SUFFIX_RE = re.compile(r'_with_(banner|subtitles|source)')
+SOURCE_PATTERN_RE = re.compile(r'.*_source_(.+)$', re.IGNORECASE)
+
+# Characters that must be backslash-escaped inside a drawtext text='...' value
+DRAWTEXT_ESCAPE_RE = re.compile(r"([':\\])")
+
+
+@lru_cache(maxsize=4096)
 def extract_source_from_filename(filename: str) -> Optional[str]:
     """
     Extract source text from filename pattern: xxx_source_SourceName.mp4
@@ -28,11 +174,10 @@ def extract_source_from_filename(filename: str) -> Optional[str]:
         
         # 🔥 FIXED: Remove any processing suffixes first
         # Remove _with_banner, _with_subtitles, etc.
-        base_name = re.sub(r'_with_(banner|subtitles|source)', '', base_name)
+        base_name = PROCESSING_SUFFIX_RE.sub('', base_name)
         
         # Pattern: anything_source_SourceText
-        pattern = r'.*_source_(.+)$'
-        match = re.search(pattern, base_name, re.IGNORECASE)
+        match = SOURCE_PATTERN_RE.search(base_name)
         
         if match:
             source_text = match.group(1)
@@ -47,9 +192,10 @@ def extract_source_from_filename(filename: str) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=8)
 def validate_font_file(font_path: str) -> bool:
     """
-    Validate if font file exists and is accessible
+    Validate if font file exists and is accessible (cached per path for the process lifetime)
     
     Args:
         font_path (str): Path to font file
@@ -63,6 +209,7 @@ def validate_font_file(font_path: str) -> bool:
         return False
 
 
+@lru_cache(maxsize=1)
 def get_plus_jakarta_font_path() -> str:
     """
     Get the path to Plus Jakarta Sans font file
@@ -84,6 +231,115 @@ def get_plus_jakarta_font_path() -> str:
     return font_path
 
 
+@lru_cache(maxsize=1)
+def get_escaped_font_path() -> Optional[str]:
+    """
+    Plus Jakarta Sans path escaped for a drawtext fontfile= option
+    
+    Returns:
+        Optional[str]: Escaped font path, or None if the font file is missing
+    """
+    font_path = get_plus_jakarta_font_path()
+    if not validate_font_file(font_path):
+        print(f"Warning: Font file not found: {font_path}")
+        return None
+    return font_path.replace("\\", "/").replace(":", "\\:")
+
+
+@lru_cache(maxsize=32)
+def _load_measure_font(font_size: int):
+    """Plus Jakarta Sans at font_size for measuring, or None if Pillow/the font is unavailable"""
+    if ImageFont is None or get_escaped_font_path() is None:
+        return None
+    try:
+        return ImageFont.truetype(get_plus_jakarta_font_path(), font_size)
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def estimate_text_width(text: str, font_size: int) -> float:
+    """
+    Rendered width of text in pixels (cached per text and size)
+    
+    Args:
+        text (str): Text as drawn by drawtext
+        font_size (int): Font size in pixels
+        
+    Returns:
+        float: Glyph-advance width from the font, or a rough estimate if it cannot be measured
+    """
+    font = _load_measure_font(font_size)
+    if font is not None:
+        try:
+            return font.getlength(text)
+        except AttributeError:  # Pillow < 8.0
+            return font.getsize(text)[0]
+    return len(text) * font_size * 0.6
+
+
+@lru_cache(maxsize=256)
+def _build_source_text_geometry(
+    source_text: str,
+    position_x: int,
+    position_y: int,
+    font_size: int,
+    font_color: str,
+    video_width: int,
+    video_height: int
+) -> Tuple[str, int, int, int, int, int]:
+    """
+    Clamped position/font size and drawtext filter string for build_source_text_filter
+    
+    Pure, so it is cached on all arguments: in a batch every file with the same text, position,
+    font and resolution reuses the result of the first one. Errors propagate (lru_cache never
+    stores an exception), so a transient failure is retried on the next call.
+    
+    Returns:
+        Tuple[str, int, int, int, int, int]: (filter, safe_x, safe_y, safe_font_size,
+        text_width_estimate, text_height_estimate)
+    """
+    # Get font path (resolved, validated and escaped once - see get_escaped_font_path)
+    font_path_escaped = get_escaped_font_path()
+    
+    # Format text with "Source: " prefix
+    formatted_text = f"Source: {source_text}"
+    
+    # Escape special characters
+    escaped_text = DRAWTEXT_ESCAPE_RE.sub(r"\\\1", formatted_text)
+    
+    # 🔥 BOUNDARY VALIDATION FOR MAPPED COORDINATES
+    # Text width from the font's glyph advances (see estimate_text_width)
+    text_width_estimate = int(estimate_text_width(formatted_text, font_size))
+    text_height_estimate = font_size + 10  # Font size + padding
+    
+    # Calculate safe boundaries
+    max_x = max(0, video_width - text_width_estimate)
+    max_y = max(font_size, video_height - text_height_estimate)
+    
+    # Apply boundary constraints
+    safe_x = max(0, min(position_x, max_x))
+    safe_y = max(font_size, min(position_y, max_y))
+    safe_font_size = max(8, min(font_size, min(video_width//10, video_height//20)))  # Adaptive max size
+    
+    # Set opacity to 50%
+    opacity = 0.35
+    
+    # Build drawtext filter with safe coordinates
+    fontfile_option = f"fontfile='{font_path_escaped}':" if font_path_escaped else ""
+    drawtext_filter = (
+        f"drawtext="
+        f"{fontfile_option}"
+        f"text='{escaped_text}':"
+        f"fontsize={safe_font_size}:"
+        f"fontcolor={font_color}:"
+        f"x={safe_x}:"
+        f"y={safe_y}:"
+        f"alpha={opacity}"
+    )
+    return drawtext_filter, safe_x, safe_y, safe_font_size, text_width_estimate, text_height_estimate
+
+
 def build_source_text_filter(
     source_text: str,
     position_x: int,
@@ -95,74 +351,85 @@ def build_source_text_filter(
 ) -> str:
     """
     Build FFmpeg drawtext filter for source text overlay WITH MAPPING SUPPORT
+    
+    The geometry and filter string come from the cached _build_source_text_geometry;
+    the diagnostics below are printed for every file.
     """
     try:
-        # Get font path
-        font_path = get_plus_jakarta_font_path()
-        
-        # Validate font
-        if not validate_font_file(font_path):
-            print(f"Warning: Font file not found: {font_path}")
-            font_path = None
-        
-        # Format text with "Source: " prefix
-        formatted_text = f"Source: {source_text}"
-        
-        # Escape special characters
-        escaped_text = formatted_text.replace("'", "\\'").replace(":", "\\:")
-        
-        # 🔥 BOUNDARY VALIDATION FOR MAPPED COORDINATES
-        # Estimate text width (rough calculation)
-        text_width_estimate = len(formatted_text) * font_size * 0.6
-        text_height_estimate = font_size + 10  # Font size + padding
-        
-        # Calculate safe boundaries
-        max_x = max(0, video_width - int(text_width_estimate))
-        max_y = max(font_size, video_height - text_height_estimate)
-        
-        # Apply boundary constraints
-        safe_x = max(0, min(position_x, max_x))
-        safe_y = max(font_size, min(position_y, max_y))
-        safe_font_size = max(8, min(font_size, min(video_width//10, video_height//20)))  # Adaptive max size
-        
-        print(f"📎 Source text mapping validation:")
-        print(f"   📐 Video: {video_width}x{video_height}")
-        print(f"   📍 Position: ({position_x}, {position_y}) → ({safe_x}, {safe_y})")
-        print(f"   🔤 Font: {font_size}px → {safe_font_size}px")
-        print(f"   📏 Text estimate: {int(text_width_estimate)}x{int(text_height_estimate)} pixels")
-        
-        # Set opacity to 50%
-        opacity = 0.35
-        
-        # Build drawtext filter with safe coordinates
-        if font_path:
-            font_path_escaped = font_path.replace("\\", "/").replace(":", "\\:")
-            drawtext_filter = (
-                f"drawtext="
-                f"fontfile='{font_path_escaped}':"
-                f"text='{escaped_text}':"
-                f"fontsize={safe_font_size}:"     
-                f"fontcolor={font_color}:"
-                f"x={safe_x}:"                    
-                f"y={safe_y}:"                    
-                f"alpha={opacity}"
-            )
-        else:
-            drawtext_filter = (
-                f"drawtext="
-                f"text='{escaped_text}':"
-                f"fontsize={safe_font_size}:"     
-                f"fontcolor={font_color}:"
-                f"x={safe_x}:"                    
-                f"y={safe_y}:"                    
-                f"alpha={opacity}"
-            )
-        
-        return drawtext_filter
-        
+        (drawtext_filter, safe_x, safe_y, safe_font_size,
+         text_width_estimate, text_height_estimate) = _build_source_text_geometry(
+            source_text, position_x, position_y, font_size, font_color, video_width, video_height
+        )
     except Exception as e:
         print(f"Error building source text filter: {e}")
         return ""
+    
+    print(f"📎 Source text mapping validation:")
+    print(f"   📐 Video: {video_width}x{video_height}")
+    print(f"   📍 Position: ({position_x}, {position_y}) → ({safe_x}, {safe_y})")
+    print(f"   🔤 Font: {font_size}px → {safe_font_size}px")
+    print(f"   📏 Text estimate: {text_width_estimate}x{text_height_estimate} pixels")
+    
+    return drawtext_filter
+
+def run_ffmpeg(cmd: list, timeout: int) -> Tuple[int, str]:
+    """
+    Run FFmpeg, streaming stderr line by line and keeping only the last STDERR_TAIL_LINES lines
+    
+    Args:
+        cmd (list): FFmpeg command
+        timeout (int): Seconds before the process is killed
+        
+    Returns:
+        Tuple[int, str]: (Return code, Tail of stderr)
+        
+    Raises:
+        subprocess.TimeoutExpired: If FFmpeg runs longer than timeout
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        encoding='utf-8',
+        errors='ignore'
+    )
+    stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+    # Drain stderr continuously so a chatty FFmpeg never blocks on a full pipe
+    reader = threading.Thread(target=stderr_tail.extend, args=(process.stderr,), daemon=True)
+    reader.start()
+    try:
+        returncode = process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        reader.join()
+        process.stderr.close()
+    return returncode, "".join(stderr_tail)
+
+
+def check_output_file(output_video_path: str, success_message: str) -> Tuple[bool, str]:
+    """
+    Verify an FFmpeg output exists and is not truncated (one os.stat call)
+    
+    Args:
+        output_video_path (str): Path to the output video
+        success_message (str): Message returned on success (output size is appended)
+        
+    Returns:
+        Tuple[bool, str]: (Success status, Log output)
+    """
+    # One stat call: no exists/getsize race if the file disappears in between
+    try:
+        file_size = os.stat(output_video_path).st_size
+    except FileNotFoundError:
+        return False, "Output file was not created"
+    if file_size > 1000:  # At least 1KB
+        return True, f"{success_message}. Output size: {file_size} bytes"
+    return False, "Output file is too small, likely corrupted"
+
 
 def add_source_text_to_video(
     input_video_path: str,
@@ -172,7 +439,12 @@ def add_source_text_to_video(
     position_y: int = 50,
     font_size: int = 14,
     font_color: str = "white",
-    ffmpeg_executable: str = None
+    ffmpeg_executable: str = None,
+    preset: str = DEFAULT_X264_PRESET,
+    hwaccel: Optional[str] = None,
+    threads: Optional[int] = None,
+    video_width: Optional[int] = None,
+    video_height: Optional[int] = None
 ) -> Tuple[bool, str]:
     """
     Add source text overlay to video using FFmpeg
@@ -180,12 +452,17 @@ def add_source_text_to_video(
     Args:
         input_video_path (str): Path to input video
         output_video_path (str): Path to output video
-        source_text (str): Text to overlay
+        source_text (str): Text to overlay (empty: the input is stream-copied unchanged)
         position_x (int): X position
         position_y (int): Y position
         font_size (int): Font size
         font_color (str): Font color
         ffmpeg_executable (str): Path to FFmpeg executable
+        preset (str): libx264 preset, one of X264_PRESETS (CPU encoding only)
+        hwaccel (Optional[str]): "nvenc", "qsv", "amf", "auto" (use detect_hwaccel) or None for libx264
+        threads (Optional[int]): FFmpeg -threads limit (None = FFmpeg default, all cores)
+        video_width (Optional[int]): Input width if the caller already knows it (None = probe with ffprobe)
+        video_height (Optional[int]): Input height if the caller already knows it (None = probe with ffprobe)
         
     Returns:
         Tuple[bool, str]: (Success status, Log output)
@@ -195,8 +472,8 @@ def add_source_text_to_video(
         if not os.path.exists(input_video_path):
             return False, f"Input video not found: {input_video_path}"
         
-        if not source_text or not source_text.strip():
-            return False, "Source text is empty"
+        if preset not in X264_PRESETS:
+            return False, f"Invalid x264 preset: {preset} (expected one of {', '.join(X264_PRESETS)})"
         
         # Set FFmpeg path
         if not ffmpeg_executable:
@@ -206,13 +483,49 @@ def add_source_text_to_video(
         if not os.path.exists(ffmpeg_executable):
             return False, f"FFmpeg not found: {ffmpeg_executable}"
         
+        if not source_text or not source_text.strip():
+            # Nothing to draw - stream-copy the input so the output still exists for later
+            # stages, without decoding or re-encoding a single frame
+            print("Source text is empty - copying video without overlay")
+            returncode, stderr_tail = run_ffmpeg(
+                [ffmpeg_executable, "-i", input_video_path, "-c", "copy", "-y", output_video_path],
+                timeout=600
+            )
+            if returncode == 0:
+                return check_output_file(output_video_path, "Source text is empty - video copied without overlay")
+            return False, f"FFmpeg stream copy failed with return code {returncode}\nStderr: {stderr_tail}"
+        
+        if hwaccel == "auto":
+            hwaccel = detect_hwaccel(ffmpeg_executable)
+        if hwaccel and hwaccel not in HW_VIDEO_CODEC_ARGS:
+            return False, f"Invalid hwaccel: {hwaccel} (expected one of {', '.join(HW_VIDEO_CODEC_ARGS)})"
+        
+        if hwaccel:
+            video_codec_args = HW_VIDEO_CODEC_ARGS[hwaccel]
+        else:
+            video_codec_args = x264_video_codec_args(preset)
+        if threads:
+            video_codec_args = [*video_codec_args, "-threads", str(threads)]
+        
+        # Real resolution for the boundary clamps - probed only when the caller did not pass it
+        # (falls back to the 1080x1920 defaults)
+        if not video_width or not video_height:
+            dimensions = get_video_dimensions(input_video_path, ffmpeg_executable)
+            if dimensions:
+                video_width, video_height = dimensions
+            else:
+                print("Could not probe video resolution - assuming 1080x1920")
+                video_width, video_height = 1080, 1920
+        
         # Build drawtext filter
         drawtext_filter = build_source_text_filter(
             source_text=source_text.strip(),
             position_x=position_x,
             position_y=position_y,
             font_size=font_size,
-            font_color=font_color
+            font_color=font_color,
+            video_width=video_width,
+            video_height=video_height
         )
         
         if not drawtext_filter:
@@ -221,45 +534,31 @@ def add_source_text_to_video(
         # Build FFmpeg command
         cmd = [
             ffmpeg_executable,
+            "-fflags", "+genpts",  # Regenerate missing input timestamps (input option)
             "-i", input_video_path,
             "-vf", drawtext_filter,
             "-c:a", "copy",  # Copy audio without re-encoding
-            "-c:v", "libx264",  # Video codec
-            "-preset", "fast",  # Encoding speed
-            "-crf", "23",  # Quality
+            *video_codec_args,  # Video codec, speed, quality
+            "-movflags", "+faststart",  # moov atom up front - no separate remux before web playback
             "-y",  # Overwrite output file
             output_video_path
         ]
         
-        print(f"Running FFmpeg command for source text overlay...")
+        print(f"Running FFmpeg command for source text overlay ({video_codec_args[1]})...")
         print(f"Source text: {source_text} (25% opacity)")
         print(f"Position: ({position_x}, {position_y})")
         print(f"Font size: {font_size}px")
         
         # Execute FFmpeg
-        result = subprocess.run(
-            cmd, 
-            capture_output=True, 
-            text=True, 
-            timeout=600,  # 10 minutes timeout
-            encoding='utf-8', 
-            errors='ignore'
-        )
+        returncode, stderr_tail = run_ffmpeg(cmd, timeout=600)  # 10 minutes timeout
         
         # Check result
-        if result.returncode == 0:
-            if os.path.exists(output_video_path):
-                file_size = os.path.getsize(output_video_path)
-                if file_size > 1000:  # At least 1KB
-                    return True, f"Source text added successfully. Output size: {file_size} bytes"
-                else:
-                    return False, "Output file is too small, likely corrupted"
-            else:
-                return False, "Output file was not created"
+        if returncode == 0:
+            return check_output_file(output_video_path, "Source text added successfully")
         else:
-            error_msg = f"FFmpeg failed with return code {result.returncode}"
-            if result.stderr:
-                error_msg += f"\nStderr: {result.stderr[-500:]}"  # Last 500 chars
+            error_msg = f"FFmpeg failed with return code {returncode}"
+            if stderr_tail:
+                error_msg += f"\nStderr: {stderr_tail}"  # Last STDERR_TAIL_LINES lines
             return False, error_msg
             
     except subprocess.TimeoutExpired:
@@ -279,7 +578,10 @@ def process_source_text_batch(
     font_color: str = "white",
     ffmpeg_executable: str = None,
     log_callback=None,
-    original_filenames: List[str] = None  # 🔥 NEW: Original filenames for extraction
+    original_filenames: List[str] = None,  # 🔥 NEW: Original filenames for extraction
+    preset: str = DEFAULT_X264_PRESET,
+    hwaccel: Optional[str] = None,
+    max_workers: Optional[int] = None
 ) -> list:
     """
     Process multiple videos with source text overlay
@@ -296,9 +598,12 @@ def process_source_text_batch(
         ffmpeg_executable (str): Path to FFmpeg
         log_callback (function): Callback function for logging
         original_filenames (List[str]): 🔥 NEW: Original filenames for source extraction
+        preset (str): libx264 preset passed to add_source_text_to_video
+        hwaccel (Optional[str]): Hardware encoder passed to add_source_text_to_video
+        max_workers (Optional[int]): Files encoded in parallel (default: cpu_count // DEFAULT_THREADS_PER_JOB)
         
     Returns:
-        list: List of successful output files
+        list: List of successful output files, in input order
     """
     def log(level, message):
         if log_callback:
@@ -324,35 +629,49 @@ def process_source_text_batch(
             log("ERROR", "❌ Original filenames required for filename extraction mode")
             return successful_files
         
-        for idx, video_file in enumerate(video_files, 1):
+        cpu_count = os.cpu_count() or 1
+        if not max_workers:
+            max_workers = max(1, cpu_count // DEFAULT_THREADS_PER_JOB)
+        # Never more lanes than files, so a short batch gives each encode more threads
+        max_workers = max(1, min(max_workers, len(video_files)))
+        threads_per_job = max(1, cpu_count // max_workers)
+        
+        # Parsed once for the whole batch instead of inside every job
+        total_files = len(video_files)
+        original_names = [os.path.basename(f) for f in original_filenames or ()]
+        
+        def process_one(idx, video_file):
+            """Encode one file; returns the output path or None (runs in the thread pool)"""
+            base_name = video_file
             try:
                 base_name = os.path.basename(video_file)
-                name_without_ext = os.path.splitext(base_name)[0]
-                file_ext = os.path.splitext(base_name)[1]
+                name_without_ext, file_ext = os.path.splitext(base_name)
                 
-                log("INFO", f"📎 Processing {idx}/{len(video_files)}: {base_name}")
+                log("INFO", f"📎 Processing {idx}/{total_files}: {base_name}")
                 
                 # 🔥 FIXED: Determine source text based on mode
                 if source_mode == "filename":
                     # Use original filename for extraction
-                    if original_filenames and idx <= len(original_filenames):
-                        original_filename = os.path.basename(original_filenames[idx - 1])
+                    if idx <= len(original_names):
+                        original_filename = original_names[idx - 1]
                         source_text = extract_source_from_filename(original_filename)
                         log("INFO", f"🔍 Extracting from original: {original_filename}")
                     else:
                         log("ERROR", f"❌ No original filename available for index {idx}")
-                        continue
-                        
+                        return None
+                    
                     if not source_text:
-                        log("WARNING", f"⚠️ No source text found in original filename: {original_filename}")
-                        continue
-                    log("SUCCESS", f"✅ Extracted source text: '{source_text}'")
+                        # Still produce the output (stream copy) so results stay aligned with inputs
+                        log("WARNING", f"⚠️ No source text found in original filename: {original_filename} - copying without overlay")
+                        source_text = ""
+                    else:
+                        log("SUCCESS", f"✅ Extracted source text: '{source_text}'")
                 else:  # custom mode
                     source_text = custom_source_text
                     if not source_text or not source_text.strip():
-                        log("WARNING", f"⚠️ Custom source text is empty, skipping: {base_name}")
-                        continue
-                    log("INFO", f"📝 Using custom text: '{source_text}'")
+                        log("WARNING", f"⚠️ Custom source text is empty - copying without overlay: {base_name}")
+                    else:
+                        log("INFO", f"📝 Using custom text: '{source_text}'")
                 
                 # Generate output path
                 output_path = os.path.join(output_dir, f"{name_without_ext}_with_source{file_ext}")
@@ -366,20 +685,33 @@ def process_source_text_batch(
                     position_y=position_y,
                     font_size=font_size,
                     font_color=font_color,
-                    ffmpeg_executable=ffmpeg_executable
+                    ffmpeg_executable=ffmpeg_executable,
+                    preset=preset,
+                    hwaccel=hwaccel,
+                    threads=threads_per_job
                 )
                 
                 if success:
-                    successful_files.append(output_path)
-                    log("SUCCESS", f"✅ Source text added successfully: {base_name}")
-                else:
-                    log("ERROR", f"❌ Failed to add source text to {base_name}: {message}")
-                    
+                    if source_text and source_text.strip():
+                        log("SUCCESS", f"✅ Source text added successfully: {base_name}")
+                    else:
+                        log("INFO", f"📋 Copied without overlay (no source text): {base_name}")
+                    return output_path
+                log("ERROR", f"❌ Failed to add source text to {base_name}: {message}")
+                return None
+                
             except Exception as e:
                 log("ERROR", f"❌ Error processing {base_name}: {str(e)}")
-                continue
+                return None
+        
+        # 🔥 Each file is an independent FFmpeg process - run several at once, each with
+        # threads_per_job threads so the parallel encodes do not oversubscribe the CPU
+        log("INFO", f"⚡ Running {max_workers} files in parallel, {threads_per_job} FFmpeg threads each")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(process_one, range(1, total_files + 1), video_files)
+            successful_files = [output_path for output_path in results if output_path]
         
-        log("SUCCESS", f"🎉 Source text batch processing complete. Successful: {len(successful_files)}/{len(video_files)}")
+        log("SUCCESS", f"🎉 Source text batch processing complete. Successful: {len(successful_files)}/{total_files}")
         return successful_files
         
     except Exception as e: